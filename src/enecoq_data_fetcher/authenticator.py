@@ -1,6 +1,8 @@
 """Authentication component for enecoQ web service."""
 
+from playwright.sync_api import Error as PlaywrightError
 from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from enecoq_data_fetcher import exceptions
 from enecoq_data_fetcher import logger
@@ -21,6 +23,35 @@ class EnecoQAuthenticator:
     # Note: Logout link uses href="#" with onclick, so we search by text
     LOGGED_IN_INDICATOR = 'a:has-text("ログアウト")'
     ERROR_MESSAGE_SELECTOR = '.error, .alert, [class*="error"]'
+    
+    # Timeout in milliseconds for filling the email field once the page
+    # has rendered either the login form or the logged-in page
+    FORM_FILL_TIMEOUT = 1000
+    
+    # Timeout in milliseconds for reading the error message after a
+    # failed login; the login result wait has already settled the page
+    ERROR_TEXT_TIMEOUT = 500
+    
+    # Fills in the credentials in a single call. Values are set through
+    # the native value setter and input and change events are dispatched,
+    # so that frameworks tracking the input value see the change.
+    # Returns false when the form is not on the page.
+    FILL_FORM_SCRIPT = """([selectors, values]) => {
+        const elements = selectors.map((selector) => document.querySelector(selector));
+        if (elements.some((element) => element === null)) {
+            return false;
+        }
+        const setValue = Object.getOwnPropertyDescriptor(
+            HTMLInputElement.prototype, "value"
+        ).set;
+        values.forEach((value, i) => {
+            const input = elements[i];
+            setValue.call(input, value);
+            input.dispatchEvent(new Event("input", { bubbles: true }));
+            input.dispatchEvent(new Event("change", { bubbles: true }));
+        });
+        return true;
+    }"""
 
     def __init__(self, email: str, password: str, user_agent: str = None):
         """Initialize authenticator with credentials.
@@ -34,13 +65,42 @@ class EnecoQAuthenticator:
         self._password = password
         self._user_agent = user_agent
         self._log = logger.get_logger()
+        self._locators = None
+        self._locator_page = None
+
+    def _bind(self, page: Page) -> dict:
+        """Return the locators for the login page elements.
+        
+        Locators are created once and reused for as long as the same
+        page is passed in. They are rebuilt when a different page is
+        used, since a locator stays tied to the page it came from.
+        
+        Args:
+            page: Playwright page object the locators belong to.
+            
+        Returns:
+            Dictionary of locators keyed by element name.
+        """
+        if self._locators is None or self._locator_page is not page:
+            self._locators = {
+                "email": page.locator(self.EMAIL_SELECTOR),
+                "password": page.locator(self.PASSWORD_SELECTOR),
+                "submit": page.locator(self.SUBMIT_SELECTOR),
+                "error": page.locator(self.ERROR_MESSAGE_SELECTOR),
+                "logout": page.locator(self.LOGGED_IN_INDICATOR),
+            }
+            self._locator_page = page
+        return self._locators
 
     def login(self, page: Page) -> None:
         """Authenticate with enecoQ web service.
         
         Navigates to the CYBERHOME login page, enters credentials,
         and submits the login form. Session cookies are automatically
-        managed by Playwright's browser context.
+        managed by Playwright's browser context, so the form is skipped
+        when the context still holds a valid session. Navigation is
+        skipped when the page already shows the login page or a
+        logged-in page.
         
         Args:
             page: Playwright page object to use for authentication.
@@ -50,44 +110,67 @@ class EnecoQAuthenticator:
                 or other authentication issues.
         """
         try:
-            # Navigate to login page
-            self._log.debug("Navigating to login page: %s", self.LOGIN_URL)
-            page.goto(self.LOGIN_URL, wait_until="networkidle")
+            locators = self._bind(page)
             
-            # Fill in email
+            # Navigate to login page unless the page is already there or
+            # already shows a valid session; a new page starts out blank
+            if page.url == self.LOGIN_URL:
+                self._log.debug("Already on login page")
+            elif page.url != "about:blank" and self.is_logged_in(page):
+                self._log.info("Existing session is still valid")
+                return
+            else:
+                self._log.debug("Navigating to login page: %s", self.LOGIN_URL)
+                page.goto(self.LOGIN_URL, wait_until="domcontentloaded")
+            
+            # Wait for the login form
             self._log.debug("Locating email input field")
-            email_input = page.locator(self.EMAIL_SELECTOR)
-            if not email_input.is_visible():
+            email_input = locators["email"]
+            # A persistent browser profile may still hold a valid session,
+            # in which case the logged-in page shows up instead of the form
+            try:
+                email_input.or_(locators["logout"]).first.wait_for(
+                    state="visible"
+                )
+            except PlaywrightTimeoutError:
                 self._log.error("Login form not found on page")
                 raise exceptions.AuthenticationError(
                     "Login form not found on page"
                 )
-            self._log.debug("Filling email field")
-            email_input.fill(self._email)
-            
-            # Fill in password (DO NOT log password value)
-            self._log.debug("Filling password field")
-            password_input = page.locator(self.PASSWORD_SELECTOR)
-            password_input.fill(self._password)
             
-            # Submit the form
+            # Fill in and submit the form (DO NOT log password value)
             self._log.debug("Submitting login form")
-            submit_button = page.locator(self.SUBMIT_SELECTOR)
-            submit_button.click()
+            if not self._submit_form(page, locators):
+                if self.is_logged_in(page):
+                    self._log.info("Existing session is still valid")
+                    return
+                self._log.error("Login form not found on page")
+                raise exceptions.AuthenticationError(
+                    "Login form not found on page"
+                )
             
-            # Wait for navigation after login
-            self._log.debug("Waiting for page load after login")
-            page.wait_for_load_state("networkidle")
+            # Wait for either the logged-in indicator or an error message
+            # instead of network idle, which keeps waiting for trackers
+            self._log.debug("Waiting for login result")
+            login_result = locators["logout"].or_(locators["error"])
+            try:
+                login_result.first.wait_for(state="visible")
+            except PlaywrightTimeoutError:
+                # Neither showed up; the status check below reports failure
+                self._log.debug("No login result indicator appeared")
             
             # Check if login was successful
             if not self.is_logged_in(page):
                 # Try to find error message
                 error_msg = "Authentication failed"
-                error_elements = page.locator(self.ERROR_MESSAGE_SELECTOR)
-                if error_elements.count() > 0:
-                    error_text = error_elements.first.text_content()
-                    if error_text:
-                        error_msg = "Authentication failed: %s" % error_text.strip()
+                try:
+                    error_text = locators["error"].first.text_content(
+                        timeout=self.ERROR_TEXT_TIMEOUT
+                    )
+                except PlaywrightTimeoutError:
+                    error_text = None
+                if error_text:
+                    error_msg = "Authentication failed: %s" % error_text.strip()
                 
                 self._log.error(error_msg)
                 raise exceptions.AuthenticationError(error_msg)
@@ -100,12 +183,80 @@ class EnecoQAuthenticator:
         except Exception as e:
             # Wrap other exceptions in AuthenticationError
             self._log.error(
-                "Login failed due to unexpected error: %s", str(e), exc_info=True
+                "Login failed due to unexpected error: %s", e, exc_info=True
             )
             raise exceptions.AuthenticationError(
-                "Login failed due to unexpected error: %s" % str(e)
+                "Login failed due to unexpected error: %s" % e
             ) from e
 
+    def _submit_form(self, page: Page, locators: dict) -> bool:
+        """Fill in the credentials and submit the login form.
+        
+        Fills in both fields with a single in-page script, and falls back
+        to filling each field through Playwright if the script fails. The
+        submit button is clicked through Playwright either way, and the
+        navigation it starts is waited for before returning.
+        
+        Args:
+            page: Playwright page object showing the login page.
+            locators: Locators returned by _bind() for the page.
+            
+        Returns:
+            True if the form was submitted, False if it is not on the page.
+        """
+        try:
+            filled = page.evaluate(
+                self.FILL_FORM_SCRIPT,
+                [
+                    [
+                        self.EMAIL_SELECTOR,
+                        self.PASSWORD_SELECTOR,
+                        self.SUBMIT_SELECTOR,
+                    ],
+                    [self._email, self._password],
+                ],
+            )
+        except PlaywrightError as e:
+            self._log.debug(
+                "In-page form filling failed, filling fields instead: %s", e
+            )
+            filled = self._fill_form(locators)
+        
+        if not filled:
+            return False
+        
+        # Wait for the page the form submits to, so that the login result
+        # is not read from elements still shown on the login page
+        self._log.debug("Clicking submit button")
+        try:
+            with page.expect_navigation(wait_until="domcontentloaded"):
+                locators["submit"].click()
+        except PlaywrightTimeoutError:
+            self._log.debug("No navigation after submitting the form")
+        return True
+
+    def _fill_form(self, locators: dict) -> bool:
+        """Fill in the credentials field by field through Playwright.
+        
+        Args:
+            locators: Locators returned by _bind() for the page.
+            
+        Returns:
+            True if the fields were filled, False if the form is not on
+            the page.
+        """
+        # The page is ready at this point, so fill() only has to wait
+        # briefly; a timeout means the logged-in page was shown instead
+        self._log.debug("Filling email field")
+        try:
+            locators["email"].fill(self._email, timeout=self.FORM_FILL_TIMEOUT)
+        except PlaywrightTimeoutError:
+            return False
+        
+        self._log.debug("Filling password field")
+        locators["password"].fill(self._password)
+        return True
+
     def is_logged_in(self, page: Page) -> bool:
         """Check if the user is currently logged in.
         
@@ -120,7 +271,7 @@ class EnecoQAuthenticator:
         """
         try:
             # Check for logout link which indicates successful login
-            logout_link = page.locator(self.LOGGED_IN_INDICATOR)
+            logout_link = self._bind(page)["logout"]
             is_logged_in = logout_link.count() > 0
             self._log.debug("Login status check: %s", is_logged_in)
             return is_logged_in
@@ -1,6 +1,5 @@
 """Command-line interface for enecoQ data fetcher."""
 
-import os
 import sys
 from datetime import datetime
 from typing import Optional
@@ -8,11 +7,20 @@ from typing import Optional
 import click
 
 from enecoq_data_fetcher import __version__
-from enecoq_data_fetcher import config as config_module
-from enecoq_data_fetcher import controller
 from enecoq_data_fetcher import exceptions
 from enecoq_data_fetcher import logger
 
+# Message label and exit code for each expected error, checked in order so
+# that the specific errors match before their EnecoQError base class.
+# Any other exception exits with 5.
+_ERROR_EXITS = (
+    (click.BadParameter, "Invalid argument", 6),
+    (exceptions.AuthenticationError, "Authentication error", 1),
+    (exceptions.FetchError, "Fetch error", 2),
+    (exceptions.ExportError, "Export error", 3),
+    (exceptions.EnecoQError, "Error", 4),
+)
+
 
 @click.command()
 @click.version_option(version=__version__, prog_name="enecoq-data-fetcher")
@@ -65,6 +73,19 @@ from enecoq_data_fetcher import logger
     default=None,
     help="Log file path (optional, no file logging by default).",
 )
+@click.option(
+    "--user-data-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Browser profile directory to reuse the login session across runs "
+    "(optional).",
+)
+@click.option(
+    "--cdp-endpoint",
+    default=None,
+    help="CDP endpoint of a running browser to reuse, such as the one "
+    "started by enecoq-data-fetcher-daemon (optional).",
+)
 def main(
     email: str,
     password: str,
@@ -74,6 +95,8 @@ def main(
     config_path: str,
     log_level: str,
     log_file: Optional[str],
+    user_data_dir: Optional[str],
+    cdp_endpoint: Optional[str],
 ) -> None:
     """enecoQ Data Fetcher - Fetch power usage data from enecoQ Web Service.
 
@@ -98,13 +121,25 @@ def main(
         # Use custom config file
         $ enecoq-data-fetcher --email user@example.com --password secret --config /path/to/config.yaml
     """
+    # Choice values are matched case-insensitively; normalize them once
+    period = period.lower()
+    output_format = output_format.lower()
+
+    # Rebound to the configured logger once logging is set up
+    log = logger.get_logger()
+
     try:
         # Validate arguments
-        _validate_arguments(email, password, period, output_format, output_path)
+        _validate_arguments(email, password, output_format, output_path)
 
-        # Load configuration
+        # Imported here so that --help, --version and invalid arguments
+        # return without loading Playwright
+        from enecoq_data_fetcher import config as config_module
+        from enecoq_data_fetcher import controller
+
+        # Load configuration; a missing config file falls back to defaults
         config = config_module.Config.load(
-            config_path=config_path if config_path != "config.yaml" or os.path.exists(config_path) else None,
+            config_path=config_path,
             log_level=log_level.upper() if log_level is not None else None,
         )
 
@@ -112,6 +147,21 @@ def main(
         if log_file is not None:
             config.log_file = log_file
 
+        # Override user_data_dir from command line if specified
+        if user_data_dir is not None:
+            config.user_data_dir = user_data_dir
+
+        # Override cdp_endpoint from command line if specified
+        if cdp_endpoint is not None:
+            config.cdp_endpoint = cdp_endpoint
+
+        # A persistent profile needs its own browser, so it cannot be used
+        # together with a shared browser
+        if config.user_data_dir and config.cdp_endpoint:
+            raise click.BadParameter(
+                "User data directory cannot be used with a CDP endpoint."
+            )
+
         # Configure logging
         log = logger.setup_logger(log_level=config.log_level, log_file=config.log_file)
         start_time = datetime.now()
@@ -130,13 +180,13 @@ def main(
 
         # Fetch power data
         power_data = enecoq_controller.fetch_power_data(
-            period=period.lower(),
-            output_format=output_format.lower(),
+            period=period,
+            output_format=output_format,
             output_path=output_path,
         )
 
         # Display success message for JSON format
-        if output_format.lower() == "json":
+        if output_format == "json":
             if output_path:
                 click.echo("Data successfully exported to: %s" % output_path)
                 log.info("Data successfully exported to: %s", output_path)
@@ -147,38 +197,13 @@ def main(
         end_time = datetime.now()
         log.info("enecoQ data fetcher completed at %s", end_time.isoformat())
 
-    except click.BadParameter as e:
-        log = logger.get_logger()
-        log.error("Invalid argument: %s", e.message)
-        click.echo("Invalid argument: %s" % e.message, err=True)
-        sys.exit(6)
-
-    except exceptions.AuthenticationError as e:
-        log = logger.get_logger()
-        log.error("Authentication error: %s", e)
-        click.echo("Authentication error: %s" % e, err=True)
-        sys.exit(1)
-
-    except exceptions.FetchError as e:
-        log = logger.get_logger()
-        log.error("Fetch error: %s", e)
-        click.echo("Fetch error: %s" % e, err=True)
-        sys.exit(2)
-
-    except exceptions.ExportError as e:
-        log = logger.get_logger()
-        log.error("Export error: %s", e)
-        click.echo("Export error: %s" % e, err=True)
-        sys.exit(3)
-
-    except exceptions.EnecoQError as e:
-        log = logger.get_logger()
-        log.error("Error: %s", e)
-        click.echo("Error: %s" % e, err=True)
-        sys.exit(4)
-
     except Exception as e:
-        log = logger.get_logger()
+        for error_type, label, exit_code in _ERROR_EXITS:
+            if isinstance(e, error_type):
+                log.error("%s: %s", label, e)
+                click.echo("%s: %s" % (label, e), err=True)
+                sys.exit(exit_code)
+
         log.error("Unexpected error: %s", e, exc_info=True)
         click.echo("Unexpected error: %s" % e, err=True)
         sys.exit(5)
@@ -187,17 +212,18 @@ def main(
 def _validate_arguments(
     email: str,
     password: str,
-    period: str,
     output_format: str,
     output_path: Optional[str],
 ) -> None:
     """Validate command-line arguments.
 
+    Period and format values are already restricted by Click's Choice type,
+    so only the checks Click cannot express are done here.
+
     Args:
         email: Email address for authentication.
         password: Password for authentication.
-        period: Data period ("today" or "month").
-        output_format: Output format ("json" or "console").
+        output_format: Normalized output format ("json" or "console").
         output_path: Optional output file path.
 
     Raises:
@@ -211,24 +237,59 @@ def _validate_arguments(
     if not password:
         raise click.BadParameter("Password cannot be empty.")
 
-    # Validate period (already validated by Click's Choice type)
-    # Additional validation if needed
-    if period.lower() not in ("today", "month"):
+    # Validate output_path is only used with JSON format
+    if output_path and output_format != "json":
         raise click.BadParameter(
-            "Invalid period: %s. Must be 'today' or 'month'." % period
+            "Output path can only be specified with JSON format."
         )
 
-    # Validate output format (already validated by Click's Choice type)
-    if output_format.lower() not in ("json", "console"):
-        raise click.BadParameter(
-            "Invalid format: %s. Must be 'json' or 'console'." % output_format
-        )
 
-    # Validate output_path is only used with JSON format
-    if output_path and output_format.lower() != "json":
-        raise click.BadParameter(
-            "Output path can only be specified with JSON format."
+@click.command()
+@click.version_option(version=__version__, prog_name="enecoq-data-fetcher-daemon")
+@click.option(
+    "--port",
+    type=click.IntRange(1, 65535),
+    default=9222,
+    help="Remote debugging port for the shared browser (default: 9222).",
+)
+def daemon(port: int) -> None:
+    """Keep a headless browser running for enecoq-data-fetcher to share.
+
+    The browser listens for CDP connections on localhost until interrupted.
+    Pass the printed endpoint to enecoq-data-fetcher with --cdp-endpoint so
+    that each run skips the browser startup.
+
+    Examples:
+
+        \b
+        # Start the shared browser
+        $ enecoq-data-fetcher-daemon --port 9222
+
+        \b
+        # Fetch data with the shared browser from another shell
+        $ enecoq-data-fetcher --email user@example.com --password secret --cdp-endpoint http://127.0.0.1:9222
+    """
+    from playwright.sync_api import sync_playwright
+
+    from enecoq_data_fetcher import controller
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(
+            headless=True,
+            args=[
+                *controller.EnecoQController.BROWSER_ARGS,
+                "--remote-debugging-port=%d" % port,
+            ],
         )
+        click.echo("http://127.0.0.1:%d" % port)
+        try:
+            # Blocks in the Playwright dispatcher, so a crashed browser
+            # ends the daemon as soon as its disconnect event arrives
+            browser.wait_for_event("disconnected", timeout=0)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            browser.close()
 
 
 if __name__ == "__main__":
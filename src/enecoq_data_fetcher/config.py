@@ -1,7 +1,8 @@
 """Configuration management for enecoQ data fetcher."""
 
-import os
+from collections import OrderedDict
 from dataclasses import dataclass
+from dataclasses import fields
 from pathlib import Path
 from typing import Optional
 
@@ -11,8 +12,21 @@ try:
 except ImportError:
     YAML_AVAILABLE = False
 
+# Prefer the libyaml-based loader, which PyYAML only ships when built
+# against libyaml
+if YAML_AVAILABLE:
+    try:
+        from yaml import CSafeLoader as _SafeLoader
+    except ImportError:
+        from yaml import SafeLoader as _SafeLoader
 
-@dataclass
+# Parsed config files keyed by resolved path, along with the mtime and size
+# of the file when it was parsed
+_CONFIG_CACHE: "OrderedDict[str, tuple[int, int, dict]]" = OrderedDict()
+_CONFIG_CACHE_MAX = 100
+
+
+@dataclass(slots=True)
 class Config:
     """Configuration for enecoQ data fetcher.
 
@@ -22,6 +36,10 @@ class Config:
         timeout: Request timeout in seconds.
         max_retries: Maximum number of retry attempts.
         user_agent: User agent string for HTTP requests.
+        user_data_dir: Browser profile directory kept across runs so that
+            a still-valid login session can be reused.
+        cdp_endpoint: Endpoint of a running Chromium to connect to over
+            CDP instead of launching a new browser.
     """
 
     log_level: str = "INFO"
@@ -33,6 +51,17 @@ class Config:
         "AppleWebKit/605.1.15 (KHTML, like Gecko) "
         "Version/26.0 Safari/605.1.15"
     )
+    user_data_dir: Optional[str] = None
+    cdp_endpoint: Optional[str] = None
+
+    @classmethod
+    def default(cls) -> "Config":
+        """Return a new configuration with default values.
+
+        Returns:
+            Config instance with default values.
+        """
+        return cls()
 
     @classmethod
     def from_file(cls, config_path: str) -> "Config":
@@ -48,29 +77,21 @@ class Config:
             FileNotFoundError: If config file doesn't exist.
             ValueError: If YAML library is not available or file is invalid.
         """
-        if not YAML_AVAILABLE:
-            raise ValueError(
-                "PyYAML is not installed. "
-                "Install it with: pip install pyyaml"
-            )
-
-        config_file = Path(config_path)
-        if not config_file.exists():
-            raise FileNotFoundError("Config file not found: %s" % config_path)
-
-        with open(config_file, "r", encoding="utf-8") as f:
-            config_data = yaml.safe_load(f)
-
-        if not config_data:
-            config_data = {}
-
-        return cls(
-            log_level=config_data.get("log_level", cls.log_level),
-            log_file=config_data.get("log_file", cls.log_file),
-            timeout=config_data.get("timeout", cls.timeout),
-            max_retries=config_data.get("max_retries", cls.max_retries),
-            user_agent=config_data.get("user_agent", cls.user_agent),
-        )
+        try:
+            config_data = _read_config_file(Path(config_path))
+        except FileNotFoundError as e:
+            raise FileNotFoundError(
+                "Config file not found: %s" % config_path
+            ) from e
+
+        # Settings missing from the file keep their defaults, and unknown
+        # keys are ignored
+        field_names = {f.name for f in fields(cls) if f.init}
+        return cls(**{
+            key: value
+            for key, value in config_data.items()
+            if key in field_names
+        })
 
     @classmethod
     def load(
@@ -91,13 +112,15 @@ class Config:
             Config instance with merged values.
         """
         # Start with default config
-        config = cls()
+        config = cls.default()
 
-        # Load from file if provided and exists
-        if config_path and os.path.exists(config_path):
+        # Load from file if provided; a missing file keeps the defaults
+        if config_path:
             try:
                 config = cls.from_file(config_path)
-            except (ValueError, FileNotFoundError):
+            except FileNotFoundError:
+                pass
+            except ValueError:
                 # If file loading fails, use defaults
                 # This allows the tool to work without YAML library
                 import logging
@@ -123,4 +146,45 @@ class Config:
             "timeout": self.timeout,
             "max_retries": self.max_retries,
             "user_agent": self.user_agent,
+            "user_data_dir": self.user_data_dir,
+            "cdp_endpoint": self.cdp_endpoint,
         }
+
+
+def _read_config_file(config_file: Path) -> dict:
+    """Parse a YAML config file, reusing the result while it is unchanged.
+
+    Args:
+        config_file: Path to configuration file.
+
+    Returns:
+        Dictionary of values from the file. The dictionary is shared
+        between calls and must not be modified.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        ValueError: If YAML library is not available.
+    """
+    # The stat doubles as the existence check
+    stat = config_file.stat()
+    key = str(config_file.resolve())
+
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        _CONFIG_CACHE.move_to_end(key)
+        return cached[2]
+
+    if not YAML_AVAILABLE:
+        raise ValueError(
+            "PyYAML is not installed. "
+            "Install it with: pip install pyyaml"
+        )
+
+    # Read as bytes so the loader decodes the UTF-8 itself
+    with open(config_file, "rb") as f:
+        config_data = yaml.load(f, Loader=_SafeLoader) or {}
+
+    _CONFIG_CACHE[key] = (stat.st_mtime_ns, stat.st_size, config_data)
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX:
+        _CONFIG_CACHE.popitem(last=False)
+    return config_data
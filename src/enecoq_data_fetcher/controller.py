@@ -1,22 +1,32 @@
 """Main controller for enecoQ data fetcher."""
 
+import logging
+import re
 import time
+from contextlib import ExitStack
+from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Optional
 
-from playwright.sync_api import sync_playwright
-
 if TYPE_CHECKING:
+    from playwright.sync_api import Browser
+    from playwright.sync_api import BrowserContext
     from playwright.sync_api import Page
+    from playwright.sync_api import Playwright
+    from playwright.sync_api import Route
 
-from enecoq_data_fetcher import authenticator
 from enecoq_data_fetcher import config as config_module
 from enecoq_data_fetcher import exceptions
-from enecoq_data_fetcher import exporter
-from enecoq_data_fetcher import fetcher
 from enecoq_data_fetcher import logger
 from enecoq_data_fetcher import models
 
+# Fetcher method for each supported period
+_FETCH_METHODS = {
+    "today": "fetch_today_data",
+    "month": "fetch_month_data",
+}
+_VALID_PERIODS = frozenset(_FETCH_METHODS)
+
 
 class EnecoQController:
     """Main controller for enecoQ data fetcher.
@@ -36,6 +46,49 @@ class EnecoQController:
     DEFAULT_BACKOFF_FACTOR = 2
     DEFAULT_TIMEOUT = 30000  # 30 seconds in milliseconds
 
+    # Keep the headless renderer at full speed while it waits on the network
+    BROWSER_ARGS = (
+        "--disable-background-timer-throttling",
+        "--disable-backgrounding-occluded-windows",
+        "--disable-renderer-backgrounding",
+    )
+
+    # File extensions of images, fonts and media, which are not needed to
+    # log in or read the values. Stylesheets are still loaded because the
+    # waits rely on visibility.
+    BLOCKED_EXTENSIONS = (
+        "avif", "bmp", "gif", "ico", "jpeg", "jpg", "png", "svg", "webp",
+        "eot", "otf", "ttf", "woff", "woff2",
+        "m4a", "mp3", "mp4", "ogg", "wav", "webm",
+    )
+
+    # Analytics and ad hosts (including their subdomains) whose requests
+    # are aborted regardless of resource type
+    BLOCKED_HOSTS = (
+        "doubleclick.net",
+        "google-analytics.com",
+        "googletagmanager.com",
+    )
+
+    # URL patterns of the requests to abort. Only these are routed, since
+    # a routed request bypasses the browser's HTTP cache; a pattern for
+    # every URL would make each request go over the network.
+    BLOCKED_URL_PATTERNS = (
+        re.compile(
+            r"\.(?:%s)(?:[?#]|$)" % "|".join(BLOCKED_EXTENSIONS),
+            re.IGNORECASE,
+        ),
+        re.compile(
+            r"^[a-z]+://(?:[^/?#]*\.)?(?:%s)(?::\d+)?(?:[/?#]|$)"
+            % "|".join(host.replace(".", r"\.") for host in BLOCKED_HOSTS),
+            re.IGNORECASE,
+        ),
+    )
+
+    # The package logger is a single object that setup_logger() configures
+    # in place, so it can be looked up once for all instances
+    _log = logger.get_logger()
+
     def __init__(
         self,
         email: str,
@@ -55,13 +108,20 @@ class EnecoQController:
         """
         self._email = email
         self._password = password
-        self._config = config or config_module.Config()
+        self._config = config or config_module.Config.default()
         self._max_retries = max_retries or self._config.max_retries
         self._backoff_factor = backoff_factor
+        # Seconds to wait after each failed attempt
+        self._wait_schedule = tuple(
+            backoff_factor ** attempt
+            for attempt in range(1, self._max_retries + 1)
+        )
+        # Modules that load Playwright are imported when first needed
+        from enecoq_data_fetcher import authenticator
+
         self._authenticator = authenticator.EnecoQAuthenticator(
             email, password, user_agent=self._config.user_agent
         )
-        self._log = logger.get_logger()
 
     def fetch_power_data(
         self,
@@ -89,7 +149,7 @@ class EnecoQController:
             ExportError: If data export fails.
         """
         # Validate period
-        if period not in ("today", "month"):
+        if period not in _VALID_PERIODS:
             self._log.error("Invalid period specified: %s", period)
             raise exceptions.FetchError(
                 "Invalid period: %s. Must be 'today' or 'month'." % period,
@@ -98,10 +158,8 @@ class EnecoQController:
 
         self._log.info("Starting data fetch for period: %s", period)
 
-        # Execute with retry logic
-        power_data = self._execute_with_retry(
-            lambda: self._fetch_data_internal(period)
-        )
+        # Fetch with retry logic in a single browser session
+        power_data = self._fetch_data_internal(period)
 
         self._log.info("Data fetch completed successfully")
 
@@ -113,6 +171,9 @@ class EnecoQController:
     def _fetch_data_internal(self, period: str) -> models.PowerData:
         """Internal method to fetch data with browser automation.
 
+        The browser and its context are launched once and shared by every
+        retry attempt, and each attempt opens and closes its own page.
+
         Args:
             period: Data period ("today" or "month").
 
@@ -121,58 +182,147 @@ class EnecoQController:
 
         Raises:
             AuthenticationError: If authentication fails.
-            FetchError: If data fetching fails.
+            FetchError: If data fetching fails after retries.
         """
+        from playwright.sync_api import sync_playwright
+
         self._log.debug("Launching browser")
-        with sync_playwright() as playwright:
-            # Launch browser
-            browser = playwright.chromium.launch(headless=True)
+        with sync_playwright() as playwright, ExitStack() as cleanup:
+            # Launch browser; everything opened is closed in reverse order
+            browser, context = self._launch_browser(playwright)
+            if browser is not None:
+                cleanup.callback(browser.close)
+            cleanup.callback(context.close)
             self._log.debug("Browser launched successfully")
             
-            try:
-                # Create browser context with timeout
-                context = browser.new_context()
-                timeout_ms = self._config.timeout * 1000  # Convert seconds to milliseconds
-                context.set_default_timeout(timeout_ms)
-                
-                try:
-                    # Create new page
-                    page = context.new_page()
-                    
-                    try:
-                        # Authenticate
-                        self._log.info("Starting authentication")
-                        self._authenticate_with_retry(page)
-                        self._log.info("Authentication successful")
-                        
-                        # Fetch data
-                        self._log.debug("Fetching %s data", period)
-                        data_fetcher = fetcher.EnecoQDataFetcher(page)
-                        
-                        if period == "today":
-                            power_data = data_fetcher.fetch_today_data()
-                        else:  # period == "month"
-                            power_data = data_fetcher.fetch_month_data()
-                        
-                        self._log.debug(
-                            "Data fetched: usage=%s, cost=%s, co2=%s",
-                            power_data.usage.value,
-                            power_data.cost.value,
-                            power_data.co2.value
-                        )
-                        return power_data
-                        
-                    finally:
-                        # Close page
-                        page.close()
-                        
-                finally:
-                    # Close context
-                    context.close()
-                    
-            finally:
-                # Close browser
-                browser.close()
+            # Set context timeout
+            timeout_ms = self._config.timeout * 1000  # Convert seconds to milliseconds
+            context.set_default_timeout(timeout_ms)
+            
+            # Skip downloads the pages do not need
+            for pattern in self.BLOCKED_URL_PATTERNS:
+                context.route(pattern, self._abort_request)
+            
+            return self._execute_with_retry(
+                lambda: self._fetch_in_new_page(context, period)
+            )
+
+    def _fetch_in_new_page(
+        self, context: "BrowserContext", period: str
+    ) -> models.PowerData:
+        """Fetch data in a new page that is closed afterwards.
+
+        Each attempt gets its own page, so nothing a failed attempt left
+        behind in the renderer carries over. The session cookies live in
+        the context and are kept.
+
+        Args:
+            context: Browser context to open the page in.
+            period: Data period ("today" or "month").
+
+        Returns:
+            PowerData object containing the fetched data.
+        """
+        page = context.new_page()
+        try:
+            return self._fetch_with_page(page, period)
+        finally:
+            page.close()
+
+    def _fetch_with_page(self, page: "Page", period: str) -> models.PowerData:
+        """Authenticate and fetch data on the given page.
+
+        Args:
+            page: Playwright page object.
+            period: Data period ("today" or "month").
+
+        Returns:
+            PowerData object containing the fetched data.
+
+        Raises:
+            AuthenticationError: If authentication fails.
+            FetchError: If data fetching fails.
+        """
+        # Authenticate
+        self._log.info("Starting authentication")
+        self._authenticate_with_retry(page)
+        self._log.info("Authentication successful")
+        
+        from enecoq_data_fetcher import fetcher
+
+        # Fetch data
+        self._log.debug("Fetching %s data", period)
+        data_fetcher = fetcher.EnecoQDataFetcher(page)
+        
+        power_data = getattr(data_fetcher, _FETCH_METHODS[period])()
+        
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug(
+                "Data fetched: usage=%s, cost=%s, co2=%s",
+                power_data.usage.value,
+                power_data.cost.value,
+                power_data.co2.value
+            )
+        return power_data
+
+    def _launch_browser(
+        self, playwright: "Playwright"
+    ) -> tuple[Optional["Browser"], "BrowserContext"]:
+        """Launch the browser and create a browser context.
+
+        When a CDP endpoint is configured, a fresh context is created in the
+        already running browser behind it, which skips the browser startup.
+        When a user data directory is configured, the context is backed by a
+        persistent profile so that session cookies survive between runs and
+        the login form can be skipped while the session is still valid.
+
+        Args:
+            playwright: Playwright instance.
+
+        Returns:
+            Tuple of the browser (None for a persistent context, which owns
+            its browser) and the browser context. Closing a browser reached
+            over CDP only disconnects from it.
+        """
+        user_agent = self._config.user_agent
+
+        if self._config.cdp_endpoint:
+            self._log.debug(
+                "Connecting to browser over CDP: %s", self._config.cdp_endpoint
+            )
+            browser = playwright.chromium.connect_over_cdp(
+                self._config.cdp_endpoint
+            )
+            return browser, browser.new_context(user_agent=user_agent)
+
+        if self._config.user_data_dir:
+            self._log.debug(
+                "Using persistent browser profile: %s", self._config.user_data_dir
+            )
+            # The profile holds session cookies, so keep it private to the user
+            user_data_dir = Path(self._config.user_data_dir).expanduser()
+            user_data_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            context = playwright.chromium.launch_persistent_context(
+                user_data_dir,
+                headless=True,
+                args=list(self.BROWSER_ARGS),
+                user_agent=user_agent,
+            )
+            return None, context
+
+        browser = playwright.chromium.launch(
+            headless=True, args=list(self.BROWSER_ARGS)
+        )
+        return browser, browser.new_context(user_agent=user_agent)
+
+    @staticmethod
+    def _abort_request(route: "Route") -> None:
+        """Abort a request matched by BLOCKED_URL_PATTERNS.
+
+        Args:
+            route: Playwright route for the intercepted request.
+        """
+        route.abort()
 
     def _authenticate_with_retry(self, page: "Page") -> None:
         """Authenticate with retry logic for session expiration.
@@ -183,42 +333,13 @@ class EnecoQController:
         Raises:
             AuthenticationError: If authentication fails after retries.
         """
-        last_error = None
-        
-        for attempt in range(1, self._max_retries + 1):
-            try:
-                self._log.debug(
-                    "Authentication attempt %s/%s", attempt, self._max_retries
-                )
-                self._authenticator.login(page)
-                return  # Success
-                
-            except exceptions.AuthenticationError as e:
-                last_error = e
-                self._log.error("Authentication failed: %s", e)
-                
-                # Don't retry on authentication errors (invalid credentials)
-                # These are not transient failures
-                raise
-                
-            except Exception as e:
-                last_error = e
-                self._log.warning("Authentication attempt %s failed: %s", attempt, e)
-                
-                # Retry on other errors (network issues, etc.)
-                if attempt < self._max_retries:
-                    wait_time = self._backoff_factor ** attempt
-                    self._log.info("Retrying in %s seconds...", wait_time)
-                    time.sleep(wait_time)
-                    continue
-        
-        # All retries exhausted
-        raise exceptions.AuthenticationError(
-            "Authentication failed after %s attempts: %s" % (
-                self._max_retries, last_error
-            ),
-            "AUTH_RETRY_EXHAUSTED",
-        ) from last_error
+        self._retry(
+            lambda: self._authenticator.login(page),
+            retry_on=(Exception,),
+            description="Authentication",
+            exhausted_error=exceptions.AuthenticationError,
+            error_code="AUTH_RETRY_EXHAUSTED",
+        )
 
     def _execute_with_retry(self, operation):
         """Execute operation with exponential backoff retry logic.
@@ -233,32 +354,70 @@ class EnecoQController:
             Result of the operation.
 
         Raises:
-            Exception: The last exception if all retries are exhausted.
+            FetchError: If all retries are exhausted.
+        """
+        return self._retry(
+            operation,
+            retry_on=(exceptions.FetchError, ConnectionError, TimeoutError),
+            description="Operation",
+            exhausted_error=exceptions.FetchError,
+            error_code="RETRY_EXHAUSTED",
+        )
+
+    def _retry(
+        self,
+        operation,
+        retry_on: tuple,
+        description: str,
+        exhausted_error: type,
+        error_code: str,
+    ):
+        """Run operation, retrying transient failures with backoff.
+
+        Authentication errors are never retried, since they mean the
+        credentials were rejected. Errors that are not listed in retry_on
+        are raised immediately.
+
+        Args:
+            operation: Callable operation to execute.
+            retry_on: Exception types that are retried.
+            description: Name of the operation used in log messages.
+            exhausted_error: EnecoQError subclass raised when all attempts
+                fail.
+            error_code: Error code for the exhausted_error.
+
+        Returns:
+            Result of the operation.
+
+        Raises:
+            AuthenticationError: If the credentials were rejected.
+            EnecoQError: The exhausted_error if all retries are exhausted.
         """
         last_error = None
         
         for attempt in range(1, self._max_retries + 1):
             try:
                 self._log.debug(
-                    "Operation attempt %s/%s", attempt, self._max_retries
+                    "%s attempt %s/%s", description, attempt, self._max_retries
                 )
                 return operation()
                 
-            except exceptions.AuthenticationError:
-                # Don't retry authentication errors
-                self._log.error("Authentication error - not retrying")
+            except exceptions.AuthenticationError as e:
+                # Don't retry authentication errors (invalid credentials)
+                self._log.error("%s failed without retry: %s", description, e)
                 raise
                 
-            except (exceptions.FetchError, ConnectionError, TimeoutError) as e:
+            except retry_on as e:
                 last_error = e
-                self._log.warning("Operation attempt %s failed: %s", attempt, e)
+                self._log.warning(
+                    "%s attempt %s failed: %s", description, attempt, e
+                )
                 
                 # Retry on transient errors
                 if attempt < self._max_retries:
-                    wait_time = self._backoff_factor ** attempt
+                    wait_time = self._wait_schedule[attempt - 1]
                     self._log.info("Retrying in %s seconds...", wait_time)
                     time.sleep(wait_time)
-                    continue
                     
             except Exception as e:
                 # Don't retry on unexpected errors
@@ -266,11 +425,11 @@ class EnecoQController:
                 raise
         
         # All retries exhausted
-        raise exceptions.FetchError(
-            "Operation failed after %s attempts: %s" % (
-                self._max_retries, last_error
+        raise exhausted_error(
+            "%s failed after %s attempts: %s" % (
+                description, self._max_retries, last_error
             ),
-            "RETRY_EXHAUSTED",
+            error_code,
         ) from last_error
 
     def _export_data(
@@ -290,10 +449,12 @@ class EnecoQController:
             ExportError: If export fails.
         """
         self._log.info("Exporting data in %s format", output_format)
+        from enecoq_data_fetcher import exporter
+
         data_exporter = exporter.DataExporter()
         
         if output_format == "json":
-            data_exporter.export_json(power_data, output_path)
+            data_exporter.write_json(power_data, output_path)
             self._log.debug("Data exported to: %s", output_path or "stdout")
         elif output_format == "console":
             data_exporter.export_console(power_data)
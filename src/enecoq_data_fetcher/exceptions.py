@@ -12,6 +12,8 @@ class EnecoQError(Exception):
         error_code: Optional error code for programmatic error handling.
     """
 
+    __slots__ = ("message", "error_code", "_rendered")
+
     def __init__(self, message: str, error_code: str | None = None) -> None:
         """Initialize the exception.
 
@@ -19,15 +21,23 @@ class EnecoQError(Exception):
             message: Human-readable error message.
             error_code: Optional error code for programmatic error handling.
         """
+        super().__init__(message)
         self.message = message
         self.error_code = error_code
-        super().__init__(message)
+        # The error is logged and echoed several times on failure paths,
+        # so its string form is built once here
+        if error_code:
+            self._rendered = f"[{error_code}] {message}"
+        else:
+            self._rendered = message
+
+    def __reduce__(self):
+        """Support pickling, which does not copy slot values by default."""
+        return type(self), (self.message, self.error_code), self.__dict__ or None
 
     def __str__(self) -> str:
         """Return string representation of the error."""
-        if self.error_code:
-            return f"[{self.error_code}] {self.message}"
-        return self.message
+        return self._rendered
 
 
 class AuthenticationError(EnecoQError):
@@ -37,6 +47,8 @@ class AuthenticationError(EnecoQError):
     session expiration, or other authentication-related issues.
     """
 
+    __slots__ = ()
+
     def __init__(
         self, message: str = "Authentication failed", error_code: str = "AUTH_ERROR"
     ) -> None:
@@ -56,6 +68,8 @@ class FetchError(EnecoQError):
     issues, server errors, or unexpected response format.
     """
 
+    __slots__ = ()
+
     def __init__(
         self, message: str = "Data fetch failed", error_code: str = "FETCH_ERROR"
     ) -> None:
@@ -75,6 +89,8 @@ class ExportError(EnecoQError):
     permission issues, or formatting problems.
     """
 
+    __slots__ = ()
+
     def __init__(
         self, message: str = "Data export failed", error_code: str = "EXPORT_ERROR"
     ) -> None:
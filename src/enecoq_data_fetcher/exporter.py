@@ -1,5 +1,6 @@
 """Data exporter for power data."""
 
+import codecs
 import json
 import sys
 from pathlib import Path
@@ -9,6 +10,29 @@ from enecoq_data_fetcher import exceptions
 from enecoq_data_fetcher import logger
 from enecoq_data_fetcher import models
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_SEPARATOR = "=" * 30
+
+_CONSOLE_TEMPLATE = (
+    f"{_SEPARATOR}\n"
+    "enecoQ Data\n"
+    f"{_SEPARATOR}\n"
+    "\n"
+    "Period: %s\n"
+    "Timestamp: %s\n"
+    "\n"
+    "Power Usage: %s %s\n"
+    "Power Cost: %s %s\n"
+    "CO2 Emission: %s %s\n"
+    "\n"
+    f"{_SEPARATOR}\n"
+)
+
 
 class DataExporter:
     """Exporter for power data.
@@ -16,9 +40,8 @@ class DataExporter:
     Handles exporting power data to various formats including JSON and console.
     """
 
-    def __init__(self):
-        """Initialize exporter."""
-        self._log = logger.get_logger()
+    # Looked up once for all instances, as in EnecoQController
+    _log = logger.get_logger()
 
     def export_json(
         self,
@@ -38,6 +61,47 @@ class DataExporter:
         Raises:
             ExportError: If file writing fails.
         """
+        return self._export_json_bytes(data, output_path).decode("utf-8")
+
+    def write_json(
+        self,
+        data: models.PowerData,
+        output_path: Optional[str] = None,
+    ) -> None:
+        """Export data as JSON without returning it.
+
+        Unlike export_json(), the document is only handled as encoded
+        bytes, which saves decoding it when the caller has no use for the
+        string.
+
+        Args:
+            data: PowerData object to export.
+            output_path: Optional file path to save JSON. If None, writes
+                JSON to stdout.
+
+        Raises:
+            ExportError: If file writing fails.
+        """
+        self._export_json_bytes(data, output_path)
+
+    def _export_json_bytes(
+        self,
+        data: models.PowerData,
+        output_path: Optional[str],
+    ) -> bytes:
+        """Serialize data to JSON and write it to a file or stdout.
+
+        Args:
+            data: PowerData object to export.
+            output_path: Optional file path to save JSON. If None, writes
+                JSON to stdout.
+
+        Returns:
+            UTF-8 encoded JSON document.
+
+        Raises:
+            ExportError: If serialization or writing fails.
+        """
         try:
             self._log.debug("Converting data to dictionary")
             # Convert data to dictionary with acquisition timestamp metadata
@@ -45,24 +109,37 @@ class DataExporter:
 
             # Format JSON with proper indentation
             self._log.debug("Serializing data to JSON")
-            json_str = json.dumps(
-                data_dict,
-                ensure_ascii=False,
-                indent=2,
-            )
+            if ORJSON_AVAILABLE:
+                # Faster than the json module below, with the same text
+                # for finite values. NaN and infinities become null rather
+                # than NaN and Infinity, and exponents are not zero-padded
+                # (1e-7 rather than 1e-07). orjson.JSONEncodeError is a
+                # TypeError.
+                json_bytes = orjson.dumps(
+                    data_dict,
+                    option=orjson.OPT_INDENT_2,
+                )
+            else:
+                json_bytes = json.dumps(
+                    data_dict,
+                    ensure_ascii=False,
+                    indent=2,
+                ).encode("utf-8")
 
             # Write to file if path is provided
             if output_path:
                 self._log.info("Writing JSON to file: %s", output_path)
                 output_file = Path(output_path)
                 output_file.parent.mkdir(parents=True, exist_ok=True)
-                output_file.write_text(json_str, encoding="utf-8")
+                # Write the encoded document as is instead of going through
+                # a text-mode file
+                output_file.write_bytes(json_bytes)
                 self._log.debug("JSON successfully written to: %s", output_path)
             else:
                 self._log.debug("Outputting JSON to stdout")
-                print(json_str)
+                _write_stdout(json_bytes + b"\n")
 
-            return json_str
+            return json_bytes
 
         except (OSError, IOError) as e:
             self._log.error("Failed to export JSON: %s", e, exc_info=True)
@@ -82,31 +159,42 @@ class DataExporter:
             data: PowerData object to display.
         """
         self._log.info("Exporting data to console")
-        
-        # Print header
-        print("=" * 30)
-        print("enecoQ Data")
-        print("=" * 30)
-        print()
-
-        # Print period and acquisition timestamp
-        print("Period: %s" % data.period)
-        print("Timestamp: %s" % data.timestamp.strftime("%Y-%m-%d %H:%M:%S"))
-        print()
 
-        # Print power usage
-        print("Power Usage: %s %s" % (data.usage.value, data.usage.unit))
+        usage, cost, co2 = data.usage, data.cost, data.co2
 
-        # Print power cost
-        print("Power Cost: %s %s" % (data.cost.value, data.cost.unit))
-
-        # Print CO2 emission
-        print("CO2 Emission: %s %s" % (data.co2.value, data.co2.unit))
-
-        print()
-        print("=" * 30)
+        # Write everything at once rather than line by line
+        sys.stdout.write(_CONSOLE_TEMPLATE % (
+            data.period,
+            data.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+            usage.value, usage.unit,
+            cost.value, cost.unit,
+            co2.value, co2.unit,
+        ))
 
         # Flush output to ensure immediate display
         sys.stdout.flush()
-        
+
         self._log.debug("Console export completed")
+
+
+def _write_stdout(output: bytes) -> None:
+    """Write UTF-8 encoded output to stdout.
+
+    The bytes go straight to the underlying binary buffer when stdout
+    encodes as UTF-8 anyway. Otherwise, or when stdout has no buffer, they
+    are decoded and written as text so stdout's own encoding applies.
+
+    Args:
+        output: UTF-8 encoded output.
+    """
+    stdout = sys.stdout
+    buffer = getattr(stdout, "buffer", None)
+    encoding = getattr(stdout, "encoding", None)
+    if buffer is not None and encoding and codecs.lookup(encoding).name == "utf-8":
+        # Keep the order of anything already written as text
+        stdout.flush()
+        buffer.write(output)
+        buffer.flush()
+    else:
+        stdout.write(output.decode("utf-8"))
+        stdout.flush()
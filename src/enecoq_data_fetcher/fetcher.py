@@ -3,12 +3,17 @@
 import re
 from datetime import datetime
 
+from playwright.sync_api import Error as PlaywrightError
 from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from enecoq_data_fetcher import exceptions
 from enecoq_data_fetcher import logger
 from enecoq_data_fetcher import models
 
+# First number in a value text such as "14.50kWh"
+_NUM_RE = re.compile(r"\d+(?:\.\d+)?")
+
 
 class EnecoQDataFetcher:
     """Fetches and parses power data from enecoQ web service.
@@ -28,6 +33,50 @@ class EnecoQDataFetcher:
     IFRAME_TIMEOUT_MS = 10000
     IFRAME_POLL_INTERVAL_MS = 500
 
+    # Label of the dropdown option for each period. The option values are
+    # not documented, so options are selected by their visible label.
+    PERIOD_LABELS = {
+        "today": "今日",
+        "month": "今月",
+    }
+
+    # Image alt text of the dt element labelling each value, and the value
+    # name used in log messages, in the order of _extract_values()
+    VALUE_LABELS = (
+        ("使用量", "Power usage"),
+        ("使用料金", "Power cost"),
+        ("CO2", "CO2 emission"),
+    )
+
+    # Returns the text of the dd element following the dt element with
+    # each given image alt text, or null where either element is missing
+    READ_VALUES_SCRIPT = """alts => alts.map(alt => {
+        const dt = Array.from(document.querySelectorAll("dt"))
+            .find(el => el.querySelector(`img[alt="${alt}"]`));
+        if (!dt) return null;
+        let dd = dt.nextElementSibling;
+        while (dd && dd.tagName !== "DD") dd = dd.nextElementSibling;
+        return dd ? dd.textContent : null;
+    })"""
+
+    # Takes alts and tells whether every value has non-empty text
+    VALUES_PRESENT_SCRIPT = (
+        "alts => (%s)(alts).every(text => text)" % READ_VALUES_SCRIPT
+    )
+
+    # Upper bound on the wait for the values to change after switching
+    # the period, and the interval they are read at meanwhile
+    DATA_UPDATE_TIMEOUT_MS = 2000
+    DATA_UPDATE_POLL_INTERVAL_MS = 100
+
+    # Upper bound on the wait for values that have not rendered yet
+    VALUE_WAIT_TIMEOUT_MS = 3000
+
+    _value_alts = tuple(alt for alt, _ in VALUE_LABELS)
+
+    # Looked up once for all instances, as in EnecoQController
+    _log = logger.get_logger()
+
     def __init__(self, page: Page) -> None:
         """Initialize fetcher with Playwright page.
 
@@ -35,7 +84,6 @@ class EnecoQDataFetcher:
             page: Playwright page object for browser interaction.
         """
         self.page = page
-        self._log = logger.get_logger()
 
     def fetch_today_data(self) -> models.PowerData:
         """Fetch and parse today's power data.
@@ -54,10 +102,10 @@ class EnecoQDataFetcher:
             return self._fetch_data_for_period("today")
         except Exception as e:
             self._log.error(
-                "Failed to fetch today's data: %s", str(e), exc_info=True
+                "Failed to fetch today's data: %s", e, exc_info=True
             )
             raise exceptions.FetchError(
-                "Failed to fetch today's data: %s" % str(e), "FETCH_TODAY_ERROR"
+                "Failed to fetch today's data: %s" % e, "FETCH_TODAY_ERROR"
             ) from e
 
     def fetch_month_data(self) -> models.PowerData:
@@ -77,10 +125,10 @@ class EnecoQDataFetcher:
             return self._fetch_data_for_period("month")
         except Exception as e:
             self._log.error(
-                "Failed to fetch month's data: %s", str(e), exc_info=True
+                "Failed to fetch month's data: %s", e, exc_info=True
             )
             raise exceptions.FetchError(
-                "Failed to fetch month's data: %s" % str(e), "FETCH_MONTH_ERROR"
+                "Failed to fetch month's data: %s" % e, "FETCH_MONTH_ERROR"
             ) from e
 
     def _fetch_data_for_period(self, period: str) -> models.PowerData:
@@ -99,25 +147,27 @@ class EnecoQDataFetcher:
         self._log.debug("Locating enecoQ iframe")
         iframe = self._get_enecoq_iframe()
         
+        # Remember the values shown before switching, to tell when the
+        # widget has updated
+        try:
+            before = self._read_value_texts(iframe)
+        except Exception as e:
+            self._log.debug("Could not read values before switching: %s", e)
+            before = None
+
         # Select period from dropdown
         self._log.debug("Selecting period: %s", period)
         self._select_period(iframe, period)
 
         # Wait for data to load
         self._log.debug("Waiting for data to load")
-        self.page.wait_for_timeout(2000)  # Wait 2 seconds for data to update
+        self._wait_for_values_update(iframe, before)
 
         # Extract data from iframe
-        self._log.debug("Extracting power usage data")
-        usage_value = self._extract_power_usage(iframe)
+        self._log.debug("Extracting power data")
+        usage_value, cost_value, co2_value = self._extract_values(iframe)
         self._log.debug("Power usage: %s kWh", usage_value)
-        
-        self._log.debug("Extracting power cost data")
-        cost_value = self._extract_power_cost(iframe)
         self._log.debug("Power cost: %s JPY", cost_value)
-        
-        self._log.debug("Extracting CO2 emission data")
-        co2_value = self._extract_co2_emission(iframe)
         self._log.debug("CO2 emission: %s kg", co2_value)
 
         # Create and return PowerData object
@@ -175,9 +225,9 @@ class EnecoQDataFetcher:
         except exceptions.FetchError:
             raise
         except Exception as e:
-            self._log.error("Failed to locate iframe: %s", str(e), exc_info=True)
+            self._log.error("Failed to locate iframe: %s", e, exc_info=True)
             raise exceptions.FetchError(
-                "Failed to locate iframe: %s" % str(e), "IFRAME_ERROR"
+                "Failed to locate iframe: %s" % e, "IFRAME_ERROR"
             ) from e
 
     def _select_period(self, iframe, period: str) -> None:
@@ -191,162 +241,138 @@ class EnecoQDataFetcher:
             FetchError: If period selection fails.
         """
         try:
-            # Locate period dropdown (combobox)
-            combobox = iframe.locator("select").first
-            
-            if period == "today":
-                # Select today option
-                self._log.debug("Selecting 'today' option from dropdown")
-                combobox.select_option(label="今日")
-            elif period == "month":
-                # Select month option
-                self._log.debug("Selecting 'month' option from dropdown")
-                combobox.select_option(label="今月")
-            else:
+            try:
+                label = self.PERIOD_LABELS[period]
+            except KeyError:
                 self._log.error("Invalid period: %s", period)
                 raise exceptions.FetchError(
                     "Invalid period: %s" % period, "INVALID_PERIOD"
-                )
+                ) from None
+
+            # Locate period dropdown (combobox) and select the option
+            combobox = iframe.locator("select").first
+            self._log.debug("Selecting '%s' option from dropdown", period)
+            combobox.select_option(label=label)
         except Exception as e:
-            self._log.error("Failed to select period: %s", str(e), exc_info=True)
+            self._log.error("Failed to select period: %s", e, exc_info=True)
             raise exceptions.FetchError(
-                "Failed to select period: %s" % str(e), "PERIOD_SELECT_ERROR"
+                "Failed to select period: %s" % e, "PERIOD_SELECT_ERROR"
             ) from e
 
-    def _extract_power_usage(self, iframe) -> float:
-        """Extract power usage value from iframe.
-
-        Uses CSS selectors and regex to extract numeric value from the iframe.
-        Returns 0.0 if data is not found.
+    def _read_value_texts(self, iframe) -> list:
+        """Read the text of every value in a single evaluation.
 
         Args:
             iframe: Frame object containing the data.
 
         Returns:
-            Power usage value in kWh.
+            Text of each value in VALUE_LABELS order, None where the
+            element is missing.
         """
-        try:
-            # Locate dt element containing the usage image
-            dt_locator = iframe.locator("dt:has(img[alt='使用量'])")
-            
-            # Check if element exists
-            if dt_locator.count() == 0:
-                self._log.warning("Power usage dt element not found")
-                return 0.0
-            
-            # Get the next sibling dd element
-            dd_locator = dt_locator.locator("xpath=following-sibling::dd[1]")
-            
-            if dd_locator.count() == 0:
-                self._log.warning("Power usage dd element not found")
-                return 0.0
-
-            # Get text content
-            text = dd_locator.first.text_content()
-            if not text:
-                self._log.warning("Power usage text is empty")
-                return 0.0
-
-            # Extract numeric value using regex (e.g., "14.50kWh" -> 14.50)
-            match = re.search(r"(\d+(?:\.\d+)?)", text)
-            if match:
-                return float(match.group(1))
-
-            self._log.warning("Could not extract numeric value from: %s", text)
-            return 0.0
-        except Exception as e:
-            # Return empty value if extraction fails
-            self._log.warning("Power usage extraction failed: %s", e)
-            return 0.0
+        return iframe.evaluate(self.READ_VALUES_SCRIPT, self._value_alts)
+
+    def _wait_for_values_update(self, iframe, before: list) -> None:
+        """Wait until every value differs from those shown before.
+
+        The widget updates its values one at a time, so the wait only ends
+        early once all of them have changed. Values may legitimately stay
+        the same after switching the period, so otherwise the wait lasts
+        DATA_UPDATE_TIMEOUT_MS, which is the fixed delay used before.
 
-    def _extract_power_cost(self, iframe) -> float:
-        """Extract power cost value from iframe.
+        Args:
+            iframe: Frame object containing the data.
+            before: Value texts read before the period was switched, or
+                None if they could not be read.
+        """
+        if before is None:
+            self.page.wait_for_timeout(self.DATA_UPDATE_TIMEOUT_MS)
+            return
+
+        waited_ms = 0
+        while True:
+            try:
+                texts = self._read_value_texts(iframe)
+            except PlaywrightError as e:
+                # The frame may be reloading after the switch
+                self._log.debug("Could not read values while waiting: %s", e)
+            else:
+                if all(text != old for text, old in zip(texts, before)):
+                    return
+
+            if waited_ms >= self.DATA_UPDATE_TIMEOUT_MS:
+                break
+
+            self.page.wait_for_timeout(self.DATA_UPDATE_POLL_INTERVAL_MS)
+            waited_ms += self.DATA_UPDATE_POLL_INTERVAL_MS
+
+        self._log.debug(
+            "Values not all changed after %sms", self.DATA_UPDATE_TIMEOUT_MS
+        )
+
+    def _extract_values(self, iframe) -> tuple[float, float, float]:
+        """Extract power usage, cost and CO2 emission values from iframe.
 
-        Uses CSS selectors and regex to extract numeric value from the iframe.
-        Returns 0.0 if data is not found.
+        All value texts are read in a single evaluation in the iframe, and
+        the numbers are parsed from them here. Values that are missing are
+        waited for up to VALUE_WAIT_TIMEOUT_MS, and a value that is still
+        not found is returned as 0.0.
 
         Args:
             iframe: Frame object containing the data.
 
         Returns:
-            Power cost value in JPY.
+            Power usage in kWh, power cost in JPY and CO2 emission in kg.
         """
         try:
-            # Locate dt element containing the cost image
-            dt_locator = iframe.locator("dt:has(img[alt='使用料金'])")
-            
-            # Check if element exists
-            if dt_locator.count() == 0:
-                self._log.warning("Power cost dt element not found")
-                return 0.0
-            
-            # Get the next sibling dd element
-            dd_locator = dt_locator.locator("xpath=following-sibling::dd[1]")
-            
-            if dd_locator.count() == 0:
-                self._log.warning("Power cost dd element not found")
-                return 0.0
-
-            # Get text content
-            text = dd_locator.first.text_content()
-            if not text:
-                self._log.warning("Power cost text is empty")
-                return 0.0
-
-            # Extract numeric value using regex (e.g., "542.02円" -> 542.02)
-            match = re.search(r"(\d+(?:\.\d+)?)", text)
-            if match:
-                return float(match.group(1))
-
-            self._log.warning("Could not extract numeric value from: %s", text)
-            return 0.0
+            texts = self._read_value_texts(iframe)
+            if not all(texts):
+                # Some values may still be rendering; wait for them here
+                # rather than failing the whole fetch into a retry
+                try:
+                    iframe.wait_for_function(
+                        self.VALUES_PRESENT_SCRIPT,
+                        arg=self._value_alts,
+                        timeout=self.VALUE_WAIT_TIMEOUT_MS,
+                    )
+                    texts = self._read_value_texts(iframe)
+                except PlaywrightTimeoutError:
+                    self._log.debug(
+                        "Values still missing after %sms",
+                        self.VALUE_WAIT_TIMEOUT_MS,
+                    )
         except Exception as e:
-            # Return empty value if extraction fails
-            self._log.warning("Power cost extraction failed: %s", e)
-            return 0.0
+            # Return empty values if extraction fails
+            self._log.warning("Power data extraction failed: %s", e)
+            return 0.0, 0.0, 0.0
 
-    def _extract_co2_emission(self, iframe) -> float:
-        """Extract CO2 emission value from iframe.
+        usage, cost, co2 = (
+            self._parse_value(text, name)
+            for text, (_, name) in zip(texts, self.VALUE_LABELS)
+        )
+        return usage, cost, co2
 
-        Uses CSS selectors and regex to extract numeric value from the iframe.
-        Returns 0.0 if data is not found.
+    def _parse_value(self, text, name: str) -> float:
+        """Parse the numeric value from a value text.
 
         Args:
-            iframe: Frame object containing the data.
+            text: Text of the dd element, or None if it was not found.
+            name: Name of the value for log messages.
 
         Returns:
-            CO2 emission value in kg.
+            Numeric value (e.g., "14.50kWh" -> 14.50), or 0.0 if the text
+            is missing or holds no number.
         """
-        try:
-            # Locate dt element containing the CO2 image
-            dt_locator = iframe.locator("dt:has(img[alt='CO2'])")
-            
-            # Check if element exists
-            if dt_locator.count() == 0:
-                self._log.warning("CO2 emission dt element not found")
-                return 0.0
-            
-            # Get the next sibling dd element
-            dd_locator = dt_locator.locator("xpath=following-sibling::dd[1]")
-            
-            if dd_locator.count() == 0:
-                self._log.warning("CO2 emission dd element not found")
-                return 0.0
-
-            # Get text content
-            text = dd_locator.first.text_content()
-            if not text:
-                self._log.warning("CO2 emission text is empty")
-                return 0.0
-
-            # Extract numeric value using regex (e.g., "6.53kg" -> 6.53)
-            match = re.search(r"(\d+(?:\.\d+)?)", text)
-            if match:
-                return float(match.group(1))
-
-            self._log.warning("Could not extract numeric value from: %s", text)
+        if text is None:
+            self._log.warning("%s element not found", name)
             return 0.0
-        except Exception as e:
-            # Return empty value if extraction fails
-            self._log.warning("CO2 emission extraction failed: %s", e)
+
+        if not text:
+            self._log.warning("%s text is empty", name)
             return 0.0
+
+        match = _NUM_RE.search(text)
+        if match:
+            return float(match.group())
+
+        self._log.warning("Could not extract numeric value from: %s", text)
+        return 0.0
@@ -2,9 +2,14 @@
 
 import logging
 import os
+import re
 from pathlib import Path
 from typing import Optional
 
+# The package logger, looked up on first use. setup_logger() configures
+# this same object in place.
+_LOGGER: Optional[logging.Logger] = None
+
 
 def setup_logger(
     log_level: str = "INFO",
@@ -19,13 +24,16 @@ def setup_logger(
     Returns:
         Configured logger instance.
     """
-    logger = logging.getLogger("enecoq_data_fetcher")
-    logger.setLevel(logging.DEBUG)
+    logger = get_logger()
     
     # Remove existing handlers to avoid duplicates
     logger.handlers.clear()
     
-    # Add sensitive data filter to logger
+    # Add sensitive data filter to logger, replacing the one added by an
+    # earlier call so that each record is scanned only once
+    for existing in list(logger.filters):
+        if isinstance(existing, SensitiveDataFilter):
+            logger.removeFilter(existing)
     sensitive_filter = SensitiveDataFilter()
     logger.addFilter(sensitive_filter)
     
@@ -56,6 +64,10 @@ def setup_logger(
     level = getattr(logging, log_level.upper(), logging.INFO)
     console_handler.setLevel(level)
     
+    # Let the logger drop records that no handler would emit, so that
+    # isEnabledFor() reflects what is actually written
+    logger.setLevel(min(handler.level for handler in logger.handlers))
+    
     return logger
 
 
@@ -65,7 +77,10 @@ def get_logger() -> logging.Logger:
     Returns:
         Logger instance.
     """
-    return logging.getLogger("enecoq_data_fetcher")
+    global _LOGGER
+    if _LOGGER is None:
+        _LOGGER = logging.getLogger("enecoq_data_fetcher")
+    return _LOGGER
 
 
 class SensitiveDataFilter(logging.Filter):
@@ -75,6 +90,11 @@ class SensitiveDataFilter(logging.Filter):
         """Initialize the filter."""
         super().__init__()
         self.sensitive_keys = ["password", "passwd", "pwd", "secret", "token"]
+        # Matches any of the keys, case-insensitively, in a single pass
+        self._sensitive_re = re.compile(
+            "|".join(re.escape(key) for key in self.sensitive_keys),
+            re.IGNORECASE,
+        )
     
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter log records to remove sensitive data.
@@ -86,11 +106,9 @@ class SensitiveDataFilter(logging.Filter):
             True to allow the record, False to block it.
         """
         # Check if message contains sensitive keywords
-        message_lower = record.getMessage().lower()
-        for key in self.sensitive_keys:
-            if key in message_lower:
-                # Mask the sensitive data
-                record.msg = self._mask_sensitive_data(str(record.msg))
+        if self._sensitive_re.search(record.getMessage()):
+            # Mask the sensitive data
+            record.msg = self._mask_sensitive_data(str(record.msg))
         return True
     
     def _mask_sensitive_data(self, message: str) -> str:
@@ -103,10 +121,9 @@ class SensitiveDataFilter(logging.Filter):
             Message with sensitive data masked.
         """
         # Simple masking - replace potential sensitive values
-        for key in self.sensitive_keys:
-            if key in message.lower():
-                # Find and mask the value after the key
-                parts = message.split(":")
-                if len(parts) > 1:
-                    return f"{parts[0]}: ****"
+        if self._sensitive_re.search(message):
+            # Find and mask the value after the key
+            parts = message.split(":")
+            if len(parts) > 1:
+                return f"{parts[0]}: ****"
         return message
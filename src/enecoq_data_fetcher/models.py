@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PowerUsage:
     """Power usage data in kWh."""
 
@@ -21,7 +21,7 @@ class PowerUsage:
         return self.value
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PowerCost:
     """Power cost data in JPY."""
 
@@ -37,7 +37,7 @@ class PowerCost:
         return self.value
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CO2Emission:
     """CO2 emission data in kg."""
 
@@ -53,7 +53,7 @@ class CO2Emission:
         return self.value
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PowerData:
     """Complete power data.
 
@@ -80,7 +80,8 @@ class PowerData:
         return {
             "period": self.period,
             "timestamp": self.timestamp.isoformat(),
-            "usage": self.usage.to_dict(),
-            "cost": self.cost.to_dict(),
-            "co2": self.co2.to_dict(),
+            # Same as each part's to_dict(), without the method calls
+            "usage": self.usage.value,
+            "cost": self.cost.value,
+            "co2": self.co2.value,
         }
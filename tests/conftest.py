@@ -0,0 +1,82 @@
+"""Shared fixtures for the test suite."""
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from click.testing import CliRunner
+
+from enecoq_data_fetcher import authenticator
+from tests import mocks
+
+EMAIL = "test@example.com"
+PASSWORD = "test123"
+
+
+@pytest.fixture(scope="module")
+def auth():
+    """Authenticator shared by the tests in a module.
+
+    Locators are cached per page, so a fresh mock page per test keeps the
+    tests independent.
+    """
+    return authenticator.EnecoQAuthenticator(email=EMAIL, password=PASSWORD)
+
+
+@pytest.fixture
+def mock_page_with_locators():
+    """Mock new page returning a dedicated mock for each login selector.
+
+    Returns:
+        Tuple of (page, email_input, password_input, submit_button,
+        logout_link, error_element) mocks.
+    """
+    mock_page = Mock(spec=mocks.PAGE_SPEC)
+    mock_page.url = "about:blank"  # New page
+    mock_page.expect_navigation.return_value = MagicMock()  # Submit navigation
+    mock_email_input = Mock(spec=mocks.LOCATOR_SPEC)
+    mock_password_input = Mock(spec=mocks.LOCATOR_SPEC)
+    mock_submit_button = Mock(spec=mocks.LOCATOR_SPEC)
+    mock_logout_link = Mock(spec=mocks.LOCATOR_SPEC)
+    mock_error_element = Mock(spec=mocks.LOCATOR_SPEC)
+    
+    locators = {
+        authenticator.EnecoQAuthenticator.EMAIL_SELECTOR: mock_email_input,
+        authenticator.EnecoQAuthenticator.PASSWORD_SELECTOR: mock_password_input,
+        authenticator.EnecoQAuthenticator.SUBMIT_SELECTOR: mock_submit_button,
+        authenticator.EnecoQAuthenticator.LOGGED_IN_INDICATOR: mock_logout_link,
+        authenticator.EnecoQAuthenticator.ERROR_MESSAGE_SELECTOR: (
+            mock_error_element
+        ),
+    }
+    mock_page.locator.side_effect = locators.__getitem__
+    
+    return (
+        mock_page,
+        mock_email_input,
+        mock_password_input,
+        mock_submit_button,
+        mock_logout_link,
+        mock_error_element,
+    )
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """CLI runner shared by the tests in a module."""
+    return CliRunner()
+
+
+@pytest.fixture
+def mock_controller_class(monkeypatch):
+    """Replace the controller class the CLI instantiates with a mock."""
+    mock_class = Mock()
+    monkeypatch.setattr(
+        "enecoq_data_fetcher.controller.EnecoQController", mock_class
+    )
+    return mock_class
+
+
+@pytest.fixture
+def mock_controller(mock_controller_class):
+    """Mock controller instance the CLI gets from the patched class."""
+    return mock_controller_class.return_value
@@ -0,0 +1,14 @@
+"""Mock specs shared by the test modules.
+
+Given a class, Mock inspects every attribute of it on each construction,
+which costs more than most of the tests. The attribute names are listed
+once here and passed as the spec instead.
+"""
+
+from playwright.sync_api import Frame
+from playwright.sync_api import Locator
+from playwright.sync_api import Page
+
+PAGE_SPEC = dir(Page)
+FRAME_SPEC = dir(Frame)
+LOCATOR_SPEC = dir(Locator)
@@ -1,18 +1,19 @@
 """Tests for CLI functionality."""
 
-from unittest.mock import Mock, patch
+import subprocess
+import sys
+from datetime import datetime
+from unittest.mock import patch
 
-from click.testing import CliRunner
+import pytest
 
 from enecoq_data_fetcher import cli
 from enecoq_data_fetcher import exceptions
 from enecoq_data_fetcher import models
-from datetime import datetime
 
 
-def test_cli_help():
+def test_cli_help(runner):
     """Test CLI help message."""
-    runner = CliRunner()
     result = runner.invoke(cli.main, ["--help"])
     
     assert result.exit_code == 0
@@ -22,89 +23,82 @@ def test_cli_help():
     assert "--period" in result.output
     assert "--format" in result.output
     assert "--config" in result.output
-    print("✓ CLI help message works")
 
 
-def test_cli_missing_required_args():
-    """Test CLI with missing required arguments."""
-    runner = CliRunner()
-    
-    # Missing email and password
-    result = runner.invoke(cli.main, [])
-    assert result.exit_code != 0
-    assert "Missing option" in result.output or "required" in result.output.lower()
-    print("✓ CLI validates required arguments")
-
-
-def test_cli_invalid_email():
-    """Test CLI with invalid email format."""
-    runner = CliRunner()
-    result = runner.invoke(cli.main, [
-        "--email", "invalid-email",
-        "--password", "test123"
-    ])
-    
-    # Debug: print exit code and output
-    if result.exit_code != 6:
-        print(f"Exit code: {result.exit_code}")
-        print(f"Output: {result.output}")
-    
-    assert result.exit_code == 6
-    assert "Invalid argument" in result.output
-    assert "email" in result.output.lower()
-    print("✓ CLI validates email format")
-
-
-def test_cli_invalid_period():
-    """Test CLI with invalid period."""
-    runner = CliRunner()
-    result = runner.invoke(cli.main, [
-        "--email", "test@example.com",
-        "--password", "test123",
-        "--period", "invalid"
-    ])
-    
-    assert result.exit_code != 0
-    assert "Invalid value" in result.output or "period" in result.output.lower()
-    print("✓ CLI validates period argument")
-
-
-def test_cli_invalid_format():
-    """Test CLI with invalid format."""
-    runner = CliRunner()
-    result = runner.invoke(cli.main, [
-        "--email", "test@example.com",
-        "--password", "test123",
-        "--format", "invalid"
-    ])
+def test_cli_import_does_not_load_playwright():
+    """Test importing the CLI does not load Playwright."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; import enecoq_data_fetcher.cli; "
+            "print('playwright' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
     
-    assert result.exit_code != 0
-    assert "Invalid value" in result.output or "format" in result.output.lower()
-    print("✓ CLI validates format argument")
+    assert result.stdout.strip() == "False"
 
 
-def test_cli_output_with_console_format():
-    """Test CLI rejects output path with console format."""
-    runner = CliRunner()
-    result = runner.invoke(cli.main, [
-        "--email", "test@example.com",
-        "--password", "test123",
-        "--format", "console",
-        "--output", "output.json"
-    ])
+@pytest.mark.parametrize("args,exit_code,needle", [
+    # Missing email and password
+    ([], 2, "Missing option"),
+    (
+        ["--email", "invalid-email", "--password", "test123"],
+        6,
+        "Invalid email address",
+    ),
+    (
+        [
+            "--email", "test@example.com",
+            "--password", "test123",
+            "--period", "invalid",
+        ],
+        2,
+        "Invalid value for '--period'",
+    ),
+    (
+        [
+            "--email", "test@example.com",
+            "--password", "test123",
+            "--format", "invalid",
+        ],
+        2,
+        "Invalid value for '--format'",
+    ),
+    (
+        [
+            "--email", "test@example.com",
+            "--password", "test123",
+            "--format", "console",
+            "--output", "output.json",
+        ],
+        6,
+        "Output path can only be specified with JSON format",
+    ),
+    (
+        [
+            "--email", "test@example.com",
+            "--password", "test123",
+            "--user-data-dir", "profile",
+            "--cdp-endpoint", "http://127.0.0.1:9222",
+        ],
+        6,
+        "cannot be used with a CDP endpoint",
+    ),
+])
+def test_cli_rejects_invalid_args(runner, args, exit_code, needle):
+    """Test CLI rejects missing or invalid arguments."""
+    result = runner.invoke(cli.main, args)
     
-    assert result.exit_code == 6
-    assert "Invalid argument" in result.output
-    print("✓ CLI validates output path with format")
+    assert result.exit_code == exit_code, result.output
+    assert needle in result.output
 
 
-@patch("enecoq_data_fetcher.cli.controller.EnecoQController")
-def test_cli_success_console_format(mock_controller_class):
+def test_cli_success_console_format(mock_controller, runner):
     """Test successful CLI execution with console format."""
-    # Create mock controller instance
-    mock_controller = Mock()
-    mock_controller_class.return_value = mock_controller
-    
     # Create mock power data
     mock_data = models.PowerData(
         period="today",
@@ -116,7 +110,6 @@ def test_cli_success_console_format(mock_controller_class):
     mock_controller.fetch_power_data.return_value = mock_data
     
     # Run CLI
-    runner = CliRunner()
     result = runner.invoke(cli.main, [
         "--email", "test@example.com",
         "--password", "test123",
@@ -130,16 +123,10 @@ def test_cli_success_console_format(mock_controller_class):
         output_format="console",
         output_path=None,
     )
-    print("✓ CLI executes successfully with console format")
 
 
-@patch("enecoq_data_fetcher.cli.controller.EnecoQController")
-def test_cli_success_json_format(mock_controller_class):
+def test_cli_success_json_format(mock_controller, runner):
     """Test successful CLI execution with JSON format."""
-    # Create mock controller instance
-    mock_controller = Mock()
-    mock_controller_class.return_value = mock_controller
-    
     # Create mock power data
     mock_data = models.PowerData(
         period="month",
@@ -151,7 +138,6 @@ def test_cli_success_json_format(mock_controller_class):
     mock_controller.fetch_power_data.return_value = mock_data
     
     # Run CLI with output file
-    runner = CliRunner()
     with runner.isolated_filesystem():
         result = runner.invoke(cli.main, [
             "--email", "test@example.com",
@@ -168,21 +154,16 @@ def test_cli_success_json_format(mock_controller_class):
             output_format="json",
             output_path="output.json",
         )
-    print("✓ CLI executes successfully with JSON format")
 
 
-@patch("enecoq_data_fetcher.cli.controller.EnecoQController")
-def test_cli_authentication_error(mock_controller_class):
+def test_cli_authentication_error(mock_controller, runner):
     """Test CLI handles authentication errors."""
-    # Create mock controller that raises AuthenticationError
-    mock_controller = Mock()
-    mock_controller_class.return_value = mock_controller
+    # Make the mock controller raise AuthenticationError
     mock_controller.fetch_power_data.side_effect = exceptions.AuthenticationError(
         "Invalid credentials"
     )
     
     # Run CLI
-    runner = CliRunner()
     result = runner.invoke(cli.main, [
         "--email", "test@example.com",
         "--password", "wrong",
@@ -191,21 +172,16 @@ def test_cli_authentication_error(mock_controller_class):
     
     assert result.exit_code == 1
     assert "Authentication error" in result.output
-    print("✓ CLI handles authentication errors")
 
 
-@patch("enecoq_data_fetcher.cli.controller.EnecoQController")
-def test_cli_fetch_error(mock_controller_class):
+def test_cli_fetch_error(mock_controller, runner):
     """Test CLI handles fetch errors."""
-    # Create mock controller that raises FetchError
-    mock_controller = Mock()
-    mock_controller_class.return_value = mock_controller
+    # Make the mock controller raise FetchError
     mock_controller.fetch_power_data.side_effect = exceptions.FetchError(
         "Network error"
     )
     
     # Run CLI
-    runner = CliRunner()
     result = runner.invoke(cli.main, [
         "--email", "test@example.com",
         "--password", "test123",
@@ -214,21 +190,16 @@ def test_cli_fetch_error(mock_controller_class):
     
     assert result.exit_code == 2
     assert "Fetch error" in result.output
-    print("✓ CLI handles fetch errors")
 
 
-@patch("enecoq_data_fetcher.cli.controller.EnecoQController")
-def test_cli_export_error(mock_controller_class):
+def test_cli_export_error(mock_controller, runner):
     """Test CLI handles export errors."""
-    # Create mock controller that raises ExportError
-    mock_controller = Mock()
-    mock_controller_class.return_value = mock_controller
+    # Make the mock controller raise ExportError
     mock_controller.fetch_power_data.side_effect = exceptions.ExportError(
         "File write error"
     )
     
     # Run CLI
-    runner = CliRunner()
     result = runner.invoke(cli.main, [
         "--email", "test@example.com",
         "--password", "test123",
@@ -237,12 +208,45 @@ def test_cli_export_error(mock_controller_class):
     
     assert result.exit_code == 3
     assert "Export error" in result.output
-    print("✓ CLI handles export errors")
 
 
-def test_cli_with_custom_config():
+def test_cli_generic_error(mock_controller, runner):
+    """Test CLI handles other enecoQ errors."""
+    # Make the mock controller raise the base EnecoQError
+    mock_controller.fetch_power_data.side_effect = exceptions.EnecoQError(
+        "Something went wrong"
+    )
+    
+    # Run CLI
+    result = runner.invoke(cli.main, [
+        "--email", "test@example.com",
+        "--password", "test123",
+        "--format", "json"
+    ])
+    
+    assert result.exit_code == 4
+    assert "Error: " in result.output
+    assert "Something went wrong" in result.output
+
+
+def test_cli_unexpected_error(mock_controller, runner):
+    """Test CLI handles unexpected errors."""
+    # Make the mock controller raise a non-enecoQ error
+    mock_controller.fetch_power_data.side_effect = RuntimeError("Boom")
+    
+    # Run CLI
+    result = runner.invoke(cli.main, [
+        "--email", "test@example.com",
+        "--password", "test123",
+        "--format", "json"
+    ])
+    
+    assert result.exit_code == 5
+    assert "Unexpected error: Boom" in result.output
+
+
+def test_cli_with_custom_config(runner):
     """Test CLI with custom config file path."""
-    runner = CliRunner()
     result = runner.invoke(cli.main, [
         "--help"
     ])
@@ -251,16 +255,10 @@ def test_cli_with_custom_config():
     assert result.exit_code == 0
     assert "--config" in result.output
     assert "config.yaml" in result.output
-    print("✓ CLI accepts custom config file path")
 
 
-@patch("enecoq_data_fetcher.cli.controller.EnecoQController")
-def test_cli_with_config_parameter(mock_controller_class):
+def test_cli_with_config_parameter(mock_controller, runner):
     """Test CLI execution with config parameter."""
-    # Create mock controller instance
-    mock_controller = Mock()
-    mock_controller_class.return_value = mock_controller
-    
     # Create mock power data
     mock_data = models.PowerData(
         period="today",
@@ -272,7 +270,6 @@ def test_cli_with_config_parameter(mock_controller_class):
     mock_controller.fetch_power_data.return_value = mock_data
     
     # Run CLI with custom config
-    runner = CliRunner()
     result = runner.invoke(cli.main, [
         "--email", "test@example.com",
         "--password", "test123",
@@ -281,21 +278,69 @@ def test_cli_with_config_parameter(mock_controller_class):
     ])
     
     assert result.exit_code == 0
-    print("✓ CLI executes with custom config parameter")
-
-
-if __name__ == "__main__":
-    test_cli_help()
-    test_cli_missing_required_args()
-    test_cli_invalid_email()
-    test_cli_invalid_period()
-    test_cli_invalid_format()
-    test_cli_output_with_console_format()
-    test_cli_success_console_format()
-    test_cli_success_json_format()
-    test_cli_authentication_error()
-    test_cli_fetch_error()
-    test_cli_export_error()
-    test_cli_with_custom_config()
-    test_cli_with_config_parameter()
-    print("\nAll CLI tests passed!")
+
+
+def test_cli_with_user_data_dir(mock_controller_class, runner):
+    """Test CLI passes the browser profile directory to the controller."""
+    # Run CLI with a persistent browser profile
+    result = runner.invoke(cli.main, [
+        "--email", "test@example.com",
+        "--password", "test123",
+        "--format", "console",
+        "--user-data-dir", "profile",
+    ])
+    
+    assert result.exit_code == 0
+    cfg = mock_controller_class.call_args.kwargs["config"]
+    assert cfg.user_data_dir == "profile"
+
+
+def test_cli_with_cdp_endpoint(mock_controller_class, runner):
+    """Test CLI passes the CDP endpoint to the controller."""
+    # Run CLI with a shared browser
+    result = runner.invoke(cli.main, [
+        "--email", "test@example.com",
+        "--password", "test123",
+        "--format", "console",
+        "--cdp-endpoint", "http://127.0.0.1:9222",
+    ])
+    
+    assert result.exit_code == 0
+    cfg = mock_controller_class.call_args.kwargs["config"]
+    assert cfg.cdp_endpoint == "http://127.0.0.1:9222"
+
+
+def test_cli_normalizes_choice_case(mock_controller, runner):
+    """Test CLI passes lowercase period and format to the controller."""
+    # Run CLI with uppercase choices
+    result = runner.invoke(cli.main, [
+        "--email", "test@example.com",
+        "--password", "test123",
+        "--period", "TODAY",
+        "--format", "CONSOLE",
+    ])
+    
+    assert result.exit_code == 0
+    mock_controller.fetch_power_data.assert_called_once_with(
+        period="today",
+        output_format="console",
+        output_path=None,
+    )
+
+
+@patch("playwright.sync_api.sync_playwright")
+def test_daemon(mock_playwright, runner):
+    """Test daemon keeps a browser with remote debugging running."""
+    mock_chromium = mock_playwright.return_value.__enter__.return_value.chromium
+    mock_browser = mock_chromium.launch.return_value
+    mock_browser.wait_for_event.side_effect = KeyboardInterrupt
+    
+    result = runner.invoke(cli.daemon, ["--port", "9333"])
+    
+    assert result.exit_code == 0
+    assert "http://127.0.0.1:9333" in result.output
+    assert "--remote-debugging-port=9333" in mock_chromium.launch.call_args.kwargs["args"]
+    mock_browser.wait_for_event.assert_called_once_with(
+        "disconnected", timeout=0
+    )
+    mock_browser.close.assert_called_once()
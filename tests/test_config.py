@@ -1,8 +1,9 @@
 """Tests for configuration management."""
 
-import os
-import tempfile
-from pathlib import Path
+from dataclasses import fields
+from unittest.mock import patch
+
+import pytest
 
 from enecoq_data_fetcher import config
 
@@ -15,9 +16,33 @@ def test_default_config():
     assert cfg.log_file is None  # No file logging by default
     assert cfg.timeout == 30
     assert cfg.max_retries == 3
-    assert "Mozilla" in cfg.user_agent
+    assert cfg.user_agent.startswith("Mozilla/")
+    assert cfg.user_data_dir is None  # No persistent profile by default
+    assert cfg.cdp_endpoint is None  # Launch a new browser by default
+
+
+def test_config_uses_slots():
+    """Test configuration instances have no per-instance dict."""
+    cfg = config.Config()
     
-    print("✓ Default config test passed")
+    assert not hasattr(cfg, "__dict__")
+
+
+def test_config_default_is_fresh_and_mutable():
+    """Test each default configuration is a separate, modifiable instance."""
+    cfg = config.Config.default()
+    
+    assert config.Config.default() is not cfg
+    assert cfg == config.Config()
+    
+    cfg.timeout = 60
+    assert cfg.timeout == 60
+    assert config.Config.default().timeout == 30
+    
+    # Overrides leave later defaults untouched
+    overridden = config.Config.load(log_level="DEBUG")
+    assert overridden.log_level == "DEBUG"
+    assert config.Config.default().log_level == "INFO"
 
 
 def test_config_to_dict():
@@ -30,7 +55,16 @@ def test_config_to_dict():
     assert cfg_dict["timeout"] == 30
     assert cfg_dict["max_retries"] == 3
     
-    print("✓ Config to_dict test passed")
+    # Each call returns a new dictionary, so changes do not leak into
+    # later calls
+    cfg_dict["log_level"] = "DEBUG"
+    assert cfg.to_dict()["log_level"] == "INFO"
+    assert set(cfg.to_dict()) == {f.name for f in fields(cfg)}
+    
+    # Derived instances get their own values
+    overridden = config.Config.load(log_level="DEBUG")
+    assert overridden.to_dict()["log_level"] == "DEBUG"
+    assert cfg.to_dict()["log_level"] == "INFO"
 
 
 def test_config_load_without_file():
@@ -41,8 +75,6 @@ def test_config_load_without_file():
     assert cfg.log_level == "DEBUG"
     assert cfg.timeout == 30
     assert cfg.max_retries == 3
-    
-    print("✓ Config load without file test passed")
 
 
 def test_config_load_with_nonexistent_file():
@@ -55,135 +87,127 @@ def test_config_load_with_nonexistent_file():
     # Should use defaults with command-line overrides
     assert cfg.log_level == "WARNING"
     assert cfg.timeout == 30
-    
-    print("✓ Config load with nonexistent file test passed")
 
 
-def test_config_from_yaml_file():
+def test_config_from_yaml_file(tmp_path):
     """Test loading configuration from YAML file."""
     # Skip if PyYAML is not available
-    if not config.YAML_AVAILABLE:
-        print("⊘ Skipping YAML test (PyYAML not installed)")
-        return
+    pytest.importorskip("yaml")
     
     # Create temporary config file
-    with tempfile.NamedTemporaryFile(
-        mode='w',
-        suffix='.yaml',
-        delete=False,
-        encoding='utf-8'
-    ) as f:
-        f.write("""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("""
 log_level: DEBUG
 log_file: custom/path.log
 timeout: 60
 max_retries: 5
 user_agent: "Custom User Agent"
-""")
-        temp_path = f.name
+user_data_dir: custom/profile
+cdp_endpoint: http://127.0.0.1:9222
+""", encoding="utf-8")
     
-    try:
-        # Load config from file
-        cfg = config.Config.from_file(temp_path)
-        
-        assert cfg.log_level == "DEBUG"
-        assert cfg.log_file == "custom/path.log"
-        assert cfg.timeout == 60
-        assert cfg.max_retries == 5
-        assert cfg.user_agent == "Custom User Agent"
-        
-        print("✓ Config from YAML file test passed")
+    # Load config from file
+    cfg = config.Config.from_file(str(config_file))
+    
+    assert cfg.log_level == "DEBUG"
+    assert cfg.log_file == "custom/path.log"
+    assert cfg.timeout == 60
+    assert cfg.max_retries == 5
+    assert cfg.user_agent == "Custom User Agent"
+    assert cfg.user_data_dir == "custom/profile"
+    assert cfg.cdp_endpoint == "http://127.0.0.1:9222"
+
+
+def test_config_from_yaml_file_with_non_ascii(tmp_path):
+    """Test loading a UTF-8 YAML file with non-ASCII values."""
+    # Skip if PyYAML is not available
+    pytest.importorskip("yaml")
+    
+    # Create temporary config file
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("log_file: ログ/enecoq.log\n", encoding="utf-8")
+    
+    # Load config from file
+    cfg = config.Config.from_file(str(config_file))
+    
+    assert cfg.log_file == "ログ/enecoq.log"
+
+
+def test_config_from_file_cache(tmp_path):
+    """Test a config file is parsed again only after it changes."""
+    # Skip if PyYAML is not available
+    pytest.importorskip("yaml")
+    
+    # Create temporary config file
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("timeout: 60\n", encoding="utf-8")
+    
+    with patch("yaml.load", wraps=config.yaml.load) as mock_load:
+        # Unchanged file is parsed once
+        assert config.Config.from_file(str(config_file)).timeout == 60
+        assert config.Config.from_file(str(config_file)).timeout == 60
+        assert mock_load.call_count == 1
         
-    finally:
-        # Clean up
-        os.unlink(temp_path)
+        # Changed file is parsed again
+        config_file.write_text("timeout: 120\n", encoding="utf-8")
+        assert config.Config.from_file(str(config_file)).timeout == 120
+        assert mock_load.call_count == 2
 
 
-def test_config_load_with_yaml_and_override():
+def test_config_load_with_yaml_and_override(tmp_path):
     """Test loading configuration from YAML with command-line override."""
     # Skip if PyYAML is not available
-    if not config.YAML_AVAILABLE:
-        print("⊘ Skipping YAML override test (PyYAML not installed)")
-        return
+    pytest.importorskip("yaml")
     
     # Create temporary config file
-    with tempfile.NamedTemporaryFile(
-        mode='w',
-        suffix='.yaml',
-        delete=False,
-        encoding='utf-8'
-    ) as f:
-        f.write("""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("""
 log_level: DEBUG
 timeout: 60
 max_retries: 5
-""")
-        temp_path = f.name
-    
-    try:
-        # Load config with override
-        cfg = config.Config.load(
-            config_path=temp_path,
-            log_level="ERROR"
-        )
-        
-        # log_level should be overridden
-        assert cfg.log_level == "ERROR"
-        # Other values should come from file
-        assert cfg.timeout == 60
-        assert cfg.max_retries == 5
-        
-        print("✓ Config load with YAML and override test passed")
-        
-    finally:
-        # Clean up
-        os.unlink(temp_path)
+""", encoding="utf-8")
+    
+    # Load config with override
+    cfg = config.Config.load(
+        config_path=str(config_file),
+        log_level="ERROR"
+    )
+    
+    # log_level should be overridden
+    assert cfg.log_level == "ERROR"
+    # Other values should come from file
+    assert cfg.timeout == 60
+    assert cfg.max_retries == 5
 
 
 def test_config_from_file_not_found():
     """Test loading configuration from non-existent file."""
     # Skip if PyYAML is not available
-    if not config.YAML_AVAILABLE:
-        print("⊘ Skipping file not found test (PyYAML not installed)")
-        return
+    pytest.importorskip("yaml")
     
-    try:
+    with pytest.raises(FileNotFoundError, match="not found"):
         config.Config.from_file("/nonexistent/config.yaml")
-        assert False, "Should have raised FileNotFoundError"
-    except FileNotFoundError as e:
-        assert "not found" in str(e)
-        print("✓ Config from_file not found test passed")
 
 
-def test_config_without_yaml_library():
+def test_config_without_yaml_library(monkeypatch, tmp_path):
     """Test configuration behavior when PyYAML is not available."""
-    # Temporarily disable YAML
-    original_yaml_available = config.YAML_AVAILABLE
-    config.YAML_AVAILABLE = False
-    
-    try:
-        # Should raise ValueError when trying to load from file
-        try:
-            config.Config.from_file("config.yaml")
-            assert False, "Should have raised ValueError"
-        except ValueError as e:
-            assert "PyYAML" in str(e)
-            print("✓ Config without YAML library test passed")
-    finally:
-        # Restore original state
-        config.YAML_AVAILABLE = original_yaml_available
-
-
-if __name__ == "__main__":
-    print("Running configuration tests...\n")
-    
-    test_default_config()
-    test_config_to_dict()
-    test_config_load_without_file()
-    test_config_load_with_nonexistent_file()
-    test_config_from_yaml_file()
-    test_config_load_with_yaml_and_override()
-    test_config_from_file_not_found()
-    test_config_without_yaml_library()
-    
-    print("\n✓ All configuration tests passed!")
+    # Create temporary config file
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("timeout: 60\n", encoding="utf-8")
+    
+    # Disable YAML for this test only
+    monkeypatch.setattr(config, "YAML_AVAILABLE", False)
+    
+    # Should raise ValueError when trying to load from file
+    with pytest.raises(ValueError, match="PyYAML"):
+        config.Config.from_file(str(config_file))
+    
+    # A missing file is still reported as missing
+    with pytest.raises(FileNotFoundError):
+        config.Config.from_file("/nonexistent/config.yaml")
+    
+    # Loading with a missing file falls back to defaults silently
+    with patch("logging.Logger.warning") as mock_warning:
+        cfg = config.Config.load(config_path="/nonexistent/config.yaml")
+    assert cfg == config.Config()
+    mock_warning.assert_not_called()
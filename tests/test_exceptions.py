@@ -1,5 +1,9 @@
 """Tests for custom exceptions."""
 
+import pickle
+
+import pytest
+
 from enecoq_data_fetcher import exceptions
 
 
@@ -10,7 +14,6 @@ def test_enecoq_error_basic():
     assert error.message == "Test error"
     assert error.error_code is None
     assert str(error) == "Test error"
-    print("✓ EnecoQError basic test passed")
 
 
 def test_enecoq_error_with_code():
@@ -20,83 +23,49 @@ def test_enecoq_error_with_code():
     assert error.message == "Test error"
     assert error.error_code == "TEST_CODE"
     assert str(error) == "[TEST_CODE] Test error"
-    print("✓ EnecoQError with code test passed")
-
-
-def test_authentication_error_default():
-    """Test AuthenticationError with default message."""
-    error = exceptions.AuthenticationError()
-    
-    assert error.message == "Authentication failed"
-    assert error.error_code == "AUTH_ERROR"
-    assert str(error) == "[AUTH_ERROR] Authentication failed"
-    print("✓ AuthenticationError default test passed")
-
-
-def test_authentication_error_custom():
-    """Test AuthenticationError with custom message."""
-    error = exceptions.AuthenticationError("Invalid credentials", "INVALID_CREDS")
-    
-    assert error.message == "Invalid credentials"
-    assert error.error_code == "INVALID_CREDS"
-    assert str(error) == "[INVALID_CREDS] Invalid credentials"
-    print("✓ AuthenticationError custom test passed")
 
 
-def test_fetch_error_default():
-    """Test FetchError with default message."""
-    error = exceptions.FetchError()
+@pytest.mark.parametrize("cls,default_msg,default_code", [
+    (exceptions.AuthenticationError, "Authentication failed", "AUTH_ERROR"),
+    (exceptions.FetchError, "Data fetch failed", "FETCH_ERROR"),
+    (exceptions.ExportError, "Data export failed", "EXPORT_ERROR"),
+])
+def test_exception_defaults(cls, default_msg, default_code):
+    """Test custom exceptions with their default message and code."""
+    error = cls()
     
-    assert error.message == "Data fetch failed"
-    assert error.error_code == "FETCH_ERROR"
-    assert str(error) == "[FETCH_ERROR] Data fetch failed"
-    print("✓ FetchError default test passed")
+    assert error.message == default_msg
+    assert error.error_code == default_code
+    assert str(error) == "[%s] %s" % (default_code, default_msg)
 
 
-def test_fetch_error_custom():
-    """Test FetchError with custom message."""
-    error = exceptions.FetchError("Network timeout", "TIMEOUT")
+@pytest.mark.parametrize("cls,message,error_code", [
+    (exceptions.AuthenticationError, "Invalid credentials", "INVALID_CREDS"),
+    (exceptions.FetchError, "Network timeout", "TIMEOUT"),
+    (exceptions.ExportError, "File write error", "FILE_ERROR"),
+])
+def test_exception_custom(cls, message, error_code):
+    """Test custom exceptions with a custom message and code."""
+    error = cls(message, error_code)
     
-    assert error.message == "Network timeout"
-    assert error.error_code == "TIMEOUT"
-    assert str(error) == "[TIMEOUT] Network timeout"
-    print("✓ FetchError custom test passed")
-
-
-def test_export_error_default():
-    """Test ExportError with default message."""
-    error = exceptions.ExportError()
-    
-    assert error.message == "Data export failed"
-    assert error.error_code == "EXPORT_ERROR"
-    assert str(error) == "[EXPORT_ERROR] Data export failed"
-    print("✓ ExportError default test passed")
-
-
-def test_export_error_custom():
-    """Test ExportError with custom message."""
-    error = exceptions.ExportError("File write error", "FILE_ERROR")
-    
-    assert error.message == "File write error"
-    assert error.error_code == "FILE_ERROR"
-    assert str(error) == "[FILE_ERROR] File write error"
-    print("✓ ExportError custom test passed")
+    assert error.message == message
+    assert error.error_code == error_code
+    assert str(error) == "[%s] %s" % (error_code, message)
 
 
 def test_exception_inheritance():
     """Test exception inheritance hierarchy."""
+    custom = (
+        exceptions.AuthenticationError,
+        exceptions.FetchError,
+        exceptions.ExportError,
+    )
+    
     # All custom exceptions should inherit from EnecoQError
-    assert issubclass(exceptions.AuthenticationError, exceptions.EnecoQError)
-    assert issubclass(exceptions.FetchError, exceptions.EnecoQError)
-    assert issubclass(exceptions.ExportError, exceptions.EnecoQError)
+    assert all(issubclass(c, exceptions.EnecoQError) for c in custom)
     
     # All should also inherit from Exception
-    assert issubclass(exceptions.EnecoQError, Exception)
-    assert issubclass(exceptions.AuthenticationError, Exception)
-    assert issubclass(exceptions.FetchError, Exception)
-    assert issubclass(exceptions.ExportError, Exception)
-    
-    print("✓ Exception inheritance test passed")
+    assert all(issubclass(c, Exception) for c in (exceptions.EnecoQError, *custom))
 
 
 def test_exception_catching():
@@ -118,69 +87,44 @@ def test_exception_catching():
         raise exceptions.ExportError("Test")
     except Exception as e:
         assert isinstance(e, exceptions.EnecoQError)
-    
-    print("✓ Exception catching test passed")
 
 
-def test_exception_raising():
+@pytest.mark.parametrize("cls,message", [
+    (exceptions.AuthenticationError, "Login failed"),
+    (exceptions.FetchError, "Network error"),
+    (exceptions.ExportError, "Write error"),
+])
+def test_exception_raising(cls, message):
     """Test raising and catching exceptions."""
-    # Test AuthenticationError
-    try:
-        raise exceptions.AuthenticationError("Login failed")
-    except exceptions.AuthenticationError as e:
-        assert "Login failed" in str(e)
-    else:
-        assert False, "Exception not raised"
-    
-    # Test FetchError
-    try:
-        raise exceptions.FetchError("Network error")
-    except exceptions.FetchError as e:
-        assert "Network error" in str(e)
-    else:
-        assert False, "Exception not raised"
-    
-    # Test ExportError
-    try:
-        raise exceptions.ExportError("Write error")
-    except exceptions.ExportError as e:
-        assert "Write error" in str(e)
-    else:
-        assert False, "Exception not raised"
-    
-    print("✓ Exception raising test passed")
+    with pytest.raises(cls, match=message):
+        raise cls(message)
 
 
 def test_exception_chaining():
     """Test exception chaining with from clause."""
     original_error = ValueError("Original error")
     
-    try:
+    with pytest.raises(exceptions.FetchError) as exc_info:
         try:
             raise original_error
         except ValueError as e:
             raise exceptions.FetchError("Wrapped error") from e
-    except exceptions.FetchError as e:
-        assert e.message == "Wrapped error"
-        assert e.__cause__ == original_error
-    
-    print("✓ Exception chaining test passed")
-
-
-if __name__ == "__main__":
-    print("Running exception tests...\n")
-    
-    test_enecoq_error_basic()
-    test_enecoq_error_with_code()
-    test_authentication_error_default()
-    test_authentication_error_custom()
-    test_fetch_error_default()
-    test_fetch_error_custom()
-    test_export_error_default()
-    test_export_error_custom()
-    test_exception_inheritance()
-    test_exception_catching()
-    test_exception_raising()
-    test_exception_chaining()
-    
-    print("\n✓ All exception tests passed!")
+    assert exc_info.value.message == "Wrapped error"
+    assert exc_info.value.__cause__ is original_error
+
+
+def test_exception_pickling():
+    """Test exceptions keep their message and code through pickling."""
+    for error in [
+        exceptions.EnecoQError("Base error"),
+        exceptions.EnecoQError("Base error", "BASE_CODE"),
+        exceptions.AuthenticationError("Invalid credentials", "AUTH_CUSTOM"),
+        exceptions.FetchError(),
+        exceptions.ExportError("Disk full"),
+    ]:
+        restored = pickle.loads(pickle.dumps(error))
+        
+        assert type(restored) is type(error)
+        assert restored.message == error.message
+        assert restored.error_code == error.error_code
+        assert str(restored) == str(error)
@@ -1,16 +1,30 @@
 """Tests for exporter functionality."""
 
+import io
+import json
+import math
 from datetime import datetime
-from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from enecoq_data_fetcher import exporter
 from enecoq_data_fetcher import models
 
 
-def test_export_json_string():
-    """Test JSON export to string."""
-    # Create test data
-    test_data = models.PowerData(
+@pytest.fixture(scope="module")
+def exp():
+    """Exporter shared by the tests in this module."""
+    return exporter.DataExporter()
+
+
+@pytest.fixture(scope="module")
+def today_data():
+    """Today's power data shared by the tests in this module.
+
+    PowerData is frozen, so sharing one instance is safe.
+    """
+    return models.PowerData(
         period="today",
         timestamp=datetime(2024, 1, 15, 10, 30, 0),
         usage=models.PowerUsage(value=12.5),
@@ -18,14 +32,11 @@ def test_export_json_string():
         co2=models.CO2Emission(value=6.25),
     )
 
-    # Create exporter
-    exp = exporter.DataExporter()
 
+def test_export_json_string(exp, today_data):
+    """Test JSON export to string."""
     # Test JSON string generation
-    json_str = exp.export_json(test_data)
-    print("JSON output:")
-    print(json_str)
-    print()
+    json_str = exp.export_json(today_data)
 
     # Verify JSON contains expected data
     assert "12.5" in json_str
@@ -33,37 +44,98 @@ def test_export_json_string():
     assert "6.25" in json_str
     assert "2024-01-15T10:30:00" in json_str
     assert "today" in json_str
-    print("✓ JSON string generation works")
 
 
-def test_export_json_file():
+def test_export_json_file(exp, today_data, tmp_path):
     """Test JSON export to file."""
+    # Test JSON file export
+    output_path = tmp_path / "test_output.json"
+    json_str = exp.export_json(today_data, str(output_path))
+    
+    assert output_path.exists()
+    content = output_path.read_text(encoding="utf-8")
+    assert content == json_str
+
+
+def test_export_json_matches_stdlib(exp, tmp_path):
+    """Test JSON export gives the same text with or without orjson."""
     # Create test data
     test_data = models.PowerData(
-        period="today",
-        timestamp=datetime(2024, 1, 15, 10, 30, 0),
-        usage=models.PowerUsage(value=12.5),
-        cost=models.PowerCost(value=350.0),
-        co2=models.CO2Emission(value=6.25),
+        period="month",
+        timestamp=datetime(2024, 1, 15, 10, 30, 0, 123456),
+        usage=models.PowerUsage(value=1234.5),
+        cost=models.PowerCost(value=0.1),
+        co2=models.CO2Emission(value=100),
     )
 
-    # Create exporter
-    exp = exporter.DataExporter()
+    with patch.object(exporter, "ORJSON_AVAILABLE", False):
+        expected = exp.export_json(test_data)
 
-    # Test JSON file export
-    output_path = "test_output.json"
-    json_str = exp.export_json(test_data, output_path)
-    
-    assert Path(output_path).exists()
-    content = Path(output_path).read_text(encoding="utf-8")
-    assert content == json_str
-    print("✓ JSON file export works")
+    assert exp.export_json(test_data) == expected
 
-    # Cleanup
-    Path(output_path).unlink()
+    # Files hold the same UTF-8 text either way
+    output_path = tmp_path / "test_output_stdlib.json"
+    for orjson_available in (False, exporter.ORJSON_AVAILABLE):
+        with patch.object(exporter, "ORJSON_AVAILABLE", orjson_available):
+            exp.export_json(test_data, str(output_path))
+        assert output_path.read_bytes() == expected.encode("utf-8")
 
 
-def test_export_console():
+def test_export_json_non_finite_values(exp):
+    """Test how each JSON path writes values that are not finite."""
+    pytest.importorskip("orjson")
+    test_data = models.PowerData(
+        period="today",
+        timestamp=datetime(2024, 1, 15, 10, 30, 0),
+        usage=models.PowerUsage(value=float("nan")),
+        cost=models.PowerCost(value=float("inf")),
+        co2=models.CO2Emission(value=1e-7),
+    )
+
+    with patch.object(exporter, "ORJSON_AVAILABLE", False):
+        stdlib_json = json.loads(exp.export_json(test_data))
+    with patch.object(exporter, "ORJSON_AVAILABLE", True):
+        orjson_str = exp.export_json(test_data)
+    orjson_json = json.loads(orjson_str)
+
+    # The json module keeps the values, orjson writes null instead
+    assert math.isnan(stdlib_json["usage"])
+    assert stdlib_json["cost"] == float("inf")
+    assert orjson_json["usage"] is None
+    assert orjson_json["cost"] is None
+
+    # Finite values parse back the same, whatever the exponent format
+    assert '"co2": 1e-7' in orjson_str
+    assert orjson_json["co2"] == stdlib_json["co2"]
+    assert orjson_json["period"] == stdlib_json["period"]
+    assert orjson_json["timestamp"] == stdlib_json["timestamp"]
+
+
+def test_write_json_stdout(exp, today_data):
+    """Test JSON export to stdout without building a string."""
+    with patch("sys.stdout", io.StringIO()):
+        expected = exp.export_json(today_data) + "\n"
+
+    # UTF-8 stdout receives the encoded bytes directly
+    raw = io.BytesIO()
+    stdout = io.TextIOWrapper(raw, encoding="utf-8")
+    stdout.write("before\n")
+    with patch("sys.stdout", stdout):
+        assert exp.write_json(today_data) is None
+    assert raw.getvalue() == ("before\n" + expected).encode("utf-8")
+
+    # Other encodings and text-only streams get text
+    for stdout in (
+        io.TextIOWrapper(io.BytesIO(), encoding="cp932"),
+        io.StringIO(),
+    ):
+        with patch("sys.stdout", stdout):
+            exp.write_json(today_data)
+        stdout.seek(0)
+        assert stdout.read() == expected
+
+
+def test_export_console(exp):
     """Test console export functionality."""
     # Create test data
     test_data = models.PowerData(
@@ -74,17 +146,24 @@ def test_export_console():
         co2=models.CO2Emission(value=225.0),
     )
 
-    # Create exporter
-    exp = exporter.DataExporter()
-
     # Test console output
-    print("Console output:")
     exp.export_console(test_data)
-    print("✓ Console export works")
-
 
-if __name__ == "__main__":
-    test_export_json_string()
-    test_export_json_file()
-    test_export_console()
-    print("\nAll tests passed!")
+    # Output is written in a single call
+    with patch("sys.stdout") as mock_stdout:
+        exp.export_console(test_data)
+    mock_stdout.write.assert_called_once_with(
+        "==============================\n"
+        "enecoQ Data\n"
+        "==============================\n"
+        "\n"
+        "Period: month\n"
+        "Timestamp: 2024-01-15 10:30:00\n"
+        "\n"
+        "Power Usage: 450.0 kWh\n"
+        "Power Cost: 12500.0 JPY\n"
+        "CO2 Emission: 225.0 kg\n"
+        "\n"
+        "==============================\n"
+    )
+    mock_stdout.flush.assert_called_once_with()
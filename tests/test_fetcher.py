@@ -3,307 +3,314 @@
 from datetime import datetime
 from unittest.mock import Mock
 
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
 from enecoq_data_fetcher import exceptions
 from enecoq_data_fetcher import fetcher
 from enecoq_data_fetcher import models
+from tests import mocks
+
+
+@pytest.fixture
+def mock_page():
+    """Mock Playwright page for a fetcher."""
+    return Mock(spec=mocks.PAGE_SPEC)
 
 
-def test_fetcher_initialization():
+def test_fetcher_initialization(mock_page):
     """Test fetcher initialization."""
-    mock_page = Mock()
     data_fetcher = fetcher.EnecoQDataFetcher(mock_page)
     
     assert data_fetcher.page == mock_page
-    print("✓ Fetcher initialization test passed")
 
 
 def _create_mock_iframe_with_data(usage_text, cost_text, co2_text):
     """Helper to create mock iframe with data elements."""
-    mock_iframe = Mock()
-    
-    def locator_side_effect(selector):
-        mock_dt = Mock()
-        mock_dd = Mock()
-        
-        if "img[alt='使用量']" in selector:
-            mock_dt.count.return_value = 1
-            mock_dd.count.return_value = 1
-            mock_dd.first.text_content.return_value = usage_text
-            mock_dt.locator.return_value = mock_dd
-            return mock_dt
-        elif "img[alt='使用料金']" in selector:
-            mock_dt.count.return_value = 1
-            mock_dd.count.return_value = 1
-            mock_dd.first.text_content.return_value = cost_text
-            mock_dt.locator.return_value = mock_dd
-            return mock_dt
-        elif "img[alt='CO2']" in selector:
-            mock_dt.count.return_value = 1
-            mock_dd.count.return_value = 1
-            mock_dd.first.text_content.return_value = co2_text
-            mock_dt.locator.return_value = mock_dd
-            return mock_dt
-        elif selector == "select":
-            mock_select = Mock()
-            return mock_select
-        return Mock()
-    
-    mock_iframe.locator.side_effect = locator_side_effect
+    mock_iframe = Mock(spec=mocks.FRAME_SPEC)
+    mock_iframe.evaluate.return_value = [usage_text, cost_text, co2_text]
     return mock_iframe
 
 
-def test_extract_power_usage_success():
-    """Test successful power usage extraction."""
-    mock_page = Mock()
+class _StubFrame:
+    """Frame stand-in that always shows the same value texts.
+
+    Cheaper than a Mock for tests that only check the parsed result. Use a
+    Mock where the calls made on the frame matter.
+    """
+
+    __slots__ = ("_texts",)
+
+    def __init__(self, texts):
+        self._texts = list(texts)
+
+    def evaluate(self, expression, arg=None):
+        return self._texts
+
+    def wait_for_function(self, expression, arg=None, timeout=None):
+        return None
+
+
+def test_extract_values_success(mock_page):
+    """Test successful extraction of all values."""
     data_fetcher = fetcher.EnecoQDataFetcher(mock_page)
     
     # Create mock iframe
-    mock_iframe = _create_mock_iframe_with_data("14.50kWh", "0円", "0kg")
+    mock_iframe = _create_mock_iframe_with_data("14.50kWh", "542.02円", "6.53kg")
+    
+    # Extract values
+    result = data_fetcher._extract_values(mock_iframe)
+    
+    assert result == (14.50, 542.02, 6.53)
     
-    # Extract value
-    result = data_fetcher._extract_power_usage(mock_iframe)
+    # All values are read in one evaluation
+    mock_iframe.evaluate.assert_called_once_with(
+        fetcher.EnecoQDataFetcher.READ_VALUES_SCRIPT,
+        ("使用量", "使用料金", "CO2"),
+    )
+    mock_iframe.locator.assert_not_called()
+
+
+@pytest.mark.parametrize("texts,expected", [
+    # Missing value should be 0.0
+    (("14.50kWh", None, "6.53kg"), (14.50, 0.0, 6.53)),
+    # Values without a number should be 0.0
+    (("", "---円", "6.53kg"), (0.0, 0.0, 6.53)),
+    # Various number formats
+    (("14.50kWh", "0円", "0kg"), (14.50, 0.0, 0.0)),
+    (("100kWh", "0円", "0kg"), (100.0, 0.0, 0.0)),
+    (("0.5kWh", "0円", "0kg"), (0.5, 0.0, 0.0)),
+    (("1234.56 kWh", "0円", "0kg"), (1234.56, 0.0, 0.0)),
+])
+def test_extract_values_parses_text(mock_page, texts, expected):
+    """Test extraction of values from their displayed text."""
+    data_fetcher = fetcher.EnecoQDataFetcher(mock_page)
     
-    assert result == 14.50
-    print("✓ Extract power usage success test passed")
+    assert data_fetcher._extract_values(_StubFrame(texts)) == expected
 
 
-def test_extract_power_usage_element_not_found():
-    """Test power usage extraction when element not found."""
-    mock_page = Mock()
+def test_extract_values_waits_for_missing_values(mock_page):
+    """Test extraction waits for values that have not rendered yet."""
     data_fetcher = fetcher.EnecoQDataFetcher(mock_page)
     
-    # Create mock iframe with element not found
-    mock_iframe = Mock()
-    mock_dt = Mock()
-    mock_dt.count.return_value = 0
-    mock_iframe.locator.return_value = mock_dt
+    # Usage renders after the first read
+    mock_iframe = Mock(spec=mocks.FRAME_SPEC)
+    mock_iframe.evaluate.side_effect = [
+        [None, "542.02円", "6.53kg"],
+        ["14.50kWh", "542.02円", "6.53kg"],
+    ]
     
-    # Extract value - should return 0.0
-    result = data_fetcher._extract_power_usage(mock_iframe)
+    result = data_fetcher._extract_values(mock_iframe)
     
-    assert result == 0.0
-    print("✓ Extract power usage element not found test passed")
-
-
-def test_extract_power_usage_empty_text():
-    """Test power usage extraction with empty text."""
-    mock_page = Mock()
-    data_fetcher = fetcher.EnecoQDataFetcher(mock_page)
+    assert result == (14.50, 542.02, 6.53)
+    mock_iframe.wait_for_function.assert_called_once_with(
+        fetcher.EnecoQDataFetcher.VALUES_PRESENT_SCRIPT,
+        arg=("使用量", "使用料金", "CO2"),
+        timeout=fetcher.EnecoQDataFetcher.VALUE_WAIT_TIMEOUT_MS,
+    )
     
-    # Create mock iframe with empty text
-    mock_iframe = Mock()
-    mock_dt = Mock()
-    mock_dd = Mock()
-    mock_dt.count.return_value = 1
-    mock_dd.count.return_value = 1
-    mock_dd.first.text_content.return_value = ""
-    mock_dt.locator.return_value = mock_dd
-    mock_iframe.locator.return_value = mock_dt
+    # Values found before the wait times out are kept
+    mock_iframe = _create_mock_iframe_with_data(None, "542.02円", "6.53kg")
+    mock_iframe.wait_for_function.side_effect = PlaywrightTimeoutError(
+        "Timeout 3000ms exceeded"
+    )
     
-    # Extract value - should return 0.0
-    result = data_fetcher._extract_power_usage(mock_iframe)
+    result = data_fetcher._extract_values(mock_iframe)
     
-    assert result == 0.0
-    print("✓ Extract power usage empty text test passed")
+    assert result == (0.0, 542.02, 6.53)
 
 
-def test_extract_power_usage_various_formats():
-    """Test power usage extraction with various formats."""
-    mock_page = Mock()
+def test_extract_values_evaluation_error(mock_page):
+    """Test extraction when the evaluation fails."""
     data_fetcher = fetcher.EnecoQDataFetcher(mock_page)
     
-    test_cases = [
-        ("14.50kWh", 14.50),
-        ("100kWh", 100.0),
-        ("0.5kWh", 0.5),
-        ("1234.56 kWh", 1234.56),
-    ]
+    # Create mock iframe whose evaluation fails
+    mock_iframe = Mock(spec=mocks.FRAME_SPEC)
+    mock_iframe.evaluate.side_effect = Exception("Frame was detached")
     
-    for text, expected in test_cases:
-        mock_iframe = _create_mock_iframe_with_data(text, "0円", "0kg")
-        result = data_fetcher._extract_power_usage(mock_iframe)
-        assert result == expected, "Failed for %s" % text
+    # All values should be 0.0
+    result = data_fetcher._extract_values(mock_iframe)
     
-    print("✓ Extract power usage various formats test passed")
+    assert result == (0.0, 0.0, 0.0)
 
 
-def test_extract_power_cost_success():
-    """Test successful power cost extraction."""
-    mock_page = Mock()
+@pytest.mark.parametrize("period,label", [
+    ("today", "今日"),
+    ("month", "今月"),
+])
+def test_select_period(mock_page, period, label):
+    """Test selecting a period."""
     data_fetcher = fetcher.EnecoQDataFetcher(mock_page)
     
-    # Create mock iframe
-    mock_iframe = _create_mock_iframe_with_data("0kWh", "542.02円", "0kg")
+    # Create mock iframe with select element
+    mock_iframe = Mock(spec=mocks.FRAME_SPEC)
+    mock_select = Mock(spec=mocks.LOCATOR_SPEC)
+    mock_select.first = mock_select
+    mock_iframe.locator.return_value = mock_select
     
-    # Extract value
-    result = data_fetcher._extract_power_cost(mock_iframe)
+    # Select period
+    data_fetcher._select_period(mock_iframe, period)
     
-    assert result == 542.02
-    print("✓ Extract power cost success test passed")
+    # Verify select_option was called with correct label
+    mock_select.select_option.assert_called_once_with(label=label)
 
 
-def test_extract_power_cost_element_not_found():
-    """Test power cost extraction when element not found."""
-    mock_page = Mock()
+def test_select_period_invalid(mock_page):
+    """Test selecting invalid period."""
     data_fetcher = fetcher.EnecoQDataFetcher(mock_page)
     
-    # Create mock iframe with element not found
-    mock_iframe = Mock()
-    mock_dt = Mock()
-    mock_dt.count.return_value = 0
-    mock_iframe.locator.return_value = mock_dt
-    
-    # Extract value - should return 0.0
-    result = data_fetcher._extract_power_cost(mock_iframe)
+    # Create mock iframe
+    mock_iframe = Mock(spec=mocks.FRAME_SPEC)
+    mock_select = Mock(spec=mocks.LOCATOR_SPEC)
+    mock_select.first = mock_select
+    mock_iframe.locator.return_value = mock_select
     
-    assert result == 0.0
-    print("✓ Extract power cost element not found test passed")
+    # Try to select invalid period
+    with pytest.raises(exceptions.FetchError, match="Invalid period"):
+        data_fetcher._select_period(mock_iframe, "invalid")
 
 
-def test_extract_co2_emission_success():
-    """Test successful CO2 emission extraction."""
-    mock_page = Mock()
+def test_select_period_error(mock_page):
+    """Test period selection with error."""
     data_fetcher = fetcher.EnecoQDataFetcher(mock_page)
     
-    # Create mock iframe
-    mock_iframe = _create_mock_iframe_with_data("0kWh", "0円", "6.53kg")
-    
-    # Extract value
-    result = data_fetcher._extract_co2_emission(mock_iframe)
+    # Create mock iframe that raises error
+    mock_iframe = Mock(spec=mocks.FRAME_SPEC)
+    mock_select = Mock(spec=mocks.LOCATOR_SPEC)
+    mock_select.first = mock_select
+    mock_select.select_option.side_effect = Exception("Selector error")
+    mock_iframe.locator.return_value = mock_select
     
-    assert result == 6.53
-    print("✓ Extract CO2 emission success test passed")
+    # Try to select period
+    with pytest.raises(exceptions.FetchError, match="Failed to select period"):
+        data_fetcher._select_period(mock_iframe, "today")
 
 
-def test_extract_co2_emission_element_not_found():
-    """Test CO2 emission extraction when element not found."""
-    mock_page = Mock()
+def test_fetch_waits_for_values_update(mock_page):
+    """Test fetching waits for the values to change instead of sleeping."""
     data_fetcher = fetcher.EnecoQDataFetcher(mock_page)
     
-    # Create mock iframe with element not found
-    mock_iframe = Mock()
-    mock_dt = Mock()
-    mock_dt.count.return_value = 0
-    mock_iframe.locator.return_value = mock_dt
+    # Values shown before switching the period, then the updated ones
+    mock_iframe = Mock(spec=mocks.FRAME_SPEC)
+    mock_iframe.evaluate.side_effect = [
+        ["1.00kWh", "30円", "0.50kg"],
+        ["1.00kWh", "30円", "0.50kg"],
+        ["14.50kWh", "542.02円", "6.53kg"],
+        ["14.50kWh", "542.02円", "6.53kg"],
+    ]
+    data_fetcher._get_enecoq_iframe = Mock(return_value=mock_iframe)
     
-    # Extract value - should return 0.0
-    result = data_fetcher._extract_co2_emission(mock_iframe)
+    result = data_fetcher.fetch_today_data()
     
-    assert result == 0.0
-    print("✓ Extract CO2 emission element not found test passed")
+    assert result.usage.value == 14.50
+    mock_page.wait_for_timeout.assert_called_once_with(
+        fetcher.EnecoQDataFetcher.DATA_UPDATE_POLL_INTERVAL_MS
+    )
 
 
-def test_select_period_today():
-    """Test selecting today period."""
-    mock_page = Mock()
+def test_fetch_waits_for_every_value_to_update(mock_page):
+    """Test fetching does not stop at the first value that updates."""
     data_fetcher = fetcher.EnecoQDataFetcher(mock_page)
     
-    # Create mock iframe with select element
-    mock_iframe = Mock()
-    mock_select = Mock()
-    mock_select.first = mock_select
-    mock_iframe.locator.return_value = mock_select
+    # Usage updates before cost and CO2 emission
+    mock_iframe = Mock(spec=mocks.FRAME_SPEC)
+    mock_iframe.evaluate.side_effect = [
+        ["1.00kWh", "30円", "0.50kg"],
+        ["14.50kWh", "30円", "0.50kg"],
+        ["14.50kWh", "542.02円", "0.50kg"],
+        ["14.50kWh", "542.02円", "6.53kg"],
+        ["14.50kWh", "542.02円", "6.53kg"],
+    ]
+    data_fetcher._get_enecoq_iframe = Mock(return_value=mock_iframe)
     
-    # Select period
-    data_fetcher._select_period(mock_iframe, "today")
+    result = data_fetcher.fetch_today_data()
     
-    # Verify select_option was called with correct label
-    mock_select.select_option.assert_called_once_with(label="今日")
-    print("✓ Select period today test passed")
+    assert (result.usage.value, result.cost.value, result.co2.value) == (
+        14.50, 542.02, 6.53
+    )
+    assert mock_page.wait_for_timeout.call_count == 2
 
 
-def test_select_period_month():
-    """Test selecting month period."""
-    mock_page = Mock()
+def test_fetch_waits_out_partly_unchanged_values(mock_page):
+    """Test a value that has not changed keeps the wait going."""
     data_fetcher = fetcher.EnecoQDataFetcher(mock_page)
     
-    # Create mock iframe with select element
-    mock_iframe = Mock()
-    mock_select = Mock()
-    mock_select.first = mock_select
-    mock_iframe.locator.return_value = mock_select
+    # CO2 emission takes longer than a poll to update
+    mock_iframe = Mock(spec=mocks.FRAME_SPEC)
+    mock_iframe.evaluate.side_effect = [
+        ["1.00kWh", "30円", "0.50kg"],
+        ["14.50kWh", "542.02円", "0.50kg"],
+        ["14.50kWh", "542.02円", "0.50kg"],
+        ["14.50kWh", "542.02円", "0.50kg"],
+        ["14.50kWh", "542.02円", "6.53kg"],
+        ["14.50kWh", "542.02円", "6.53kg"],
+    ]
+    data_fetcher._get_enecoq_iframe = Mock(return_value=mock_iframe)
     
-    # Select period
-    data_fetcher._select_period(mock_iframe, "month")
+    result = data_fetcher.fetch_month_data()
     
-    # Verify select_option was called with correct label
-    mock_select.select_option.assert_called_once_with(label="今月")
-    print("✓ Select period month test passed")
+    assert result.co2.value == 6.53
+    assert mock_page.wait_for_timeout.call_count == 3
 
 
-def test_select_period_invalid():
-    """Test selecting invalid period."""
-    mock_page = Mock()
+def test_fetch_keeps_waiting_while_frame_reloads(mock_page):
+    """Test a failed read during the update does not fail the fetch."""
     data_fetcher = fetcher.EnecoQDataFetcher(mock_page)
     
-    # Create mock iframe
-    mock_iframe = Mock()
-    mock_select = Mock()
-    mock_select.first = mock_select
-    mock_iframe.locator.return_value = mock_select
+    mock_iframe = Mock(spec=mocks.FRAME_SPEC)
+    mock_iframe.evaluate.side_effect = [
+        ["1.00kWh", "30円", "0.50kg"],
+        fetcher.PlaywrightError("Execution context was destroyed"),
+        ["14.50kWh", "542.02円", "6.53kg"],
+        ["14.50kWh", "542.02円", "6.53kg"],
+    ]
+    data_fetcher._get_enecoq_iframe = Mock(return_value=mock_iframe)
     
-    # Try to select invalid period
-    try:
-        data_fetcher._select_period(mock_iframe, "invalid")
-        assert False, "Should have raised FetchError"
-    except exceptions.FetchError as e:
-        assert "Invalid period" in str(e)
+    result = data_fetcher.fetch_today_data()
     
-    print("✓ Select period invalid test passed")
+    assert result.usage.value == 14.50
+    mock_page.wait_for_timeout.assert_called_once_with(
+        fetcher.EnecoQDataFetcher.DATA_UPDATE_POLL_INTERVAL_MS
+    )
 
 
-def test_select_period_error():
-    """Test period selection with error."""
-    mock_page = Mock()
+def test_fetch_tolerates_unchanged_values(mock_page):
+    """Test fetching proceeds when the values do not change."""
     data_fetcher = fetcher.EnecoQDataFetcher(mock_page)
     
-    # Create mock iframe that raises error
-    mock_iframe = Mock()
-    mock_select = Mock()
-    mock_select.first = mock_select
-    mock_select.select_option.side_effect = Exception("Selector error")
-    mock_iframe.locator.return_value = mock_select
+    # Values stay the same after switching the period
+    mock_iframe = _create_mock_iframe_with_data("14.50kWh", "542.02円", "6.53kg")
+    data_fetcher._get_enecoq_iframe = Mock(return_value=mock_iframe)
     
-    # Try to select period
-    try:
-        data_fetcher._select_period(mock_iframe, "today")
-        assert False, "Should have raised FetchError"
-    except exceptions.FetchError as e:
-        assert "Failed to select period" in str(e)
+    result = data_fetcher.fetch_month_data()
     
-    print("✓ Select period error test passed")
+    assert result.period == "month"
+    assert result.cost.value == 542.02
+    # The wait gives up after DATA_UPDATE_TIMEOUT_MS
+    assert mock_page.wait_for_timeout.call_count == (
+        fetcher.EnecoQDataFetcher.DATA_UPDATE_TIMEOUT_MS
+        // fetcher.EnecoQDataFetcher.DATA_UPDATE_POLL_INTERVAL_MS
+    )
 
 
-def test_fetch_today_data_error():
+def test_fetch_today_data_error(mock_page):
     """Test today data fetch with error."""
-    mock_page = Mock()
     mock_page.wait_for_selector.side_effect = Exception("Network error")
     data_fetcher = fetcher.EnecoQDataFetcher(mock_page)
     
     # Try to fetch data
-    try:
+    with pytest.raises(exceptions.FetchError, match="Failed to fetch today's data"):
         data_fetcher.fetch_today_data()
-        assert False, "Should have raised FetchError"
-    except exceptions.FetchError as e:
-        assert "Failed to fetch today's data" in str(e)
-    
-    print("✓ Fetch today data error test passed")
 
 
-def test_fetch_month_data_error():
+def test_fetch_month_data_error(mock_page):
     """Test month data fetch with error."""
-    mock_page = Mock()
     mock_page.wait_for_selector.side_effect = Exception("Network error")
     data_fetcher = fetcher.EnecoQDataFetcher(mock_page)
     
     # Try to fetch data
-    try:
+    with pytest.raises(exceptions.FetchError, match="Failed to fetch month's data"):
         data_fetcher.fetch_month_data()
-        assert False, "Should have raised FetchError"
-    except exceptions.FetchError as e:
-        assert "Failed to fetch month's data" in str(e)
-    
-    print("✓ Fetch month data error test passed")
 
 
 def _create_mock_frame(url, has_data_marker):
@@ -316,11 +323,11 @@ def _create_mock_frame(url, has_data_marker):
     Returns:
         Mock frame object.
     """
-    mock_frame = Mock()
+    mock_frame = Mock(spec=mocks.FRAME_SPEC)
     mock_frame.url = url
     
     def locator_side_effect(selector):
-        mock_locator = Mock()
+        mock_locator = Mock(spec=mocks.LOCATOR_SPEC)
         if "img[alt='使用量']" in selector:
             mock_locator.count.return_value = 1 if has_data_marker else 0
         else:
@@ -331,9 +338,8 @@ def _create_mock_frame(url, has_data_marker):
     return mock_frame
 
 
-def test_get_enecoq_iframe_found_by_data_marker():
+def test_get_enecoq_iframe_found_by_data_marker(mock_page):
     """Test iframe lookup returns the frame holding enecoQ data."""
-    mock_page = Mock()
     weather_frame = _create_mock_frame(
         "https://ap.otenki.com/index.php", has_data_marker=False
     )
@@ -349,10 +355,9 @@ def test_get_enecoq_iframe_found_by_data_marker():
     result = data_fetcher._get_enecoq_iframe()
     
     assert result is enecoq_frame
-    print("✓ Get enecoQ iframe found by data marker test passed")
 
 
-def test_get_enecoq_iframe_no_fallback_to_unrelated_frame():
+def test_get_enecoq_iframe_no_fallback_to_unrelated_frame(mock_page):
     """Test iframe lookup never falls back to an unrelated frame.
 
     The enecoQ widget is unavailable for a while after the month rollover.
@@ -360,7 +365,6 @@ def test_get_enecoq_iframe_no_fallback_to_unrelated_frame():
     elements, so returning one of them makes the period selection hang until
     it times out. An unavailable widget must fail fast instead.
     """
-    mock_page = Mock()
     weather_frame = _create_mock_frame(
         "https://ap.otenki.com/index.php", has_data_marker=False
     )
@@ -370,20 +374,15 @@ def test_get_enecoq_iframe_no_fallback_to_unrelated_frame():
     )
     data_fetcher = fetcher.EnecoQDataFetcher(mock_page)
     
-    try:
+    with pytest.raises(exceptions.FetchError) as exc_info:
         data_fetcher._get_enecoq_iframe()
-        assert False, "Should have raised FetchError"
-    except exceptions.FetchError as e:
-        assert e.error_code == "IFRAME_NOT_FOUND", (
-            "Unexpected error code: %s" % e.error_code
-        )
-    
-    print("✓ Get enecoQ iframe no fallback to unrelated frame test passed")
+    assert exc_info.value.error_code == "IFRAME_NOT_FOUND", (
+        "Unexpected error code: %s" % exc_info.value.error_code
+    )
 
 
-def test_get_enecoq_iframe_waits_for_late_rendering():
+def test_get_enecoq_iframe_waits_for_late_rendering(mock_page):
     """Test iframe lookup waits for the widget to finish rendering."""
-    mock_page = Mock()
     enecoq_frame = _create_mock_frame(
         "https://ses.me-eco.jp/mini/", has_data_marker=False
     )
@@ -402,29 +401,3 @@ def test_get_enecoq_iframe_waits_for_late_rendering():
     
     assert result is enecoq_frame
     assert mock_page.wait_for_timeout.called
-    print("✓ Get enecoQ iframe waits for late rendering test passed")
-
-
-if __name__ == "__main__":
-    print("Running fetcher tests...\n")
-    
-    test_fetcher_initialization()
-    test_extract_power_usage_success()
-    test_extract_power_usage_element_not_found()
-    test_extract_power_usage_empty_text()
-    test_extract_power_usage_various_formats()
-    test_extract_power_cost_success()
-    test_extract_power_cost_element_not_found()
-    test_extract_co2_emission_success()
-    test_extract_co2_emission_element_not_found()
-    test_select_period_today()
-    test_select_period_month()
-    test_select_period_invalid()
-    test_select_period_error()
-    test_fetch_today_data_error()
-    test_fetch_month_data_error()
-    test_get_enecoq_iframe_found_by_data_marker()
-    test_get_enecoq_iframe_no_fallback_to_unrelated_frame()
-    test_get_enecoq_iframe_waits_for_late_rendering()
-    
-    print("\n✓ All fetcher tests passed!")
@@ -6,24 +6,23 @@ the complete workflow of the application.
 
 import json
 import os
-import tempfile
+import subprocess
+import sys
 from datetime import datetime
-from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
+
 from enecoq_data_fetcher import cli
 from enecoq_data_fetcher import config
 from enecoq_data_fetcher import controller
 from enecoq_data_fetcher import exceptions
 from enecoq_data_fetcher import models
-from click.testing import CliRunner
 
 
-def test_end_to_end_json_output():
+def test_end_to_end_json_output(runner):
     """Test complete workflow with JSON output to file."""
-    print("\n=== Testing end-to-end JSON output ===")
-    
-    with patch("enecoq_data_fetcher.controller.sync_playwright") as mock_playwright:
+    with patch("playwright.sync_api.sync_playwright") as mock_playwright:
         # Setup mock browser automation
         mock_browser = Mock()
         mock_context = Mock()
@@ -47,7 +46,6 @@ def test_end_to_end_json_output():
                 mock_fetch.return_value = mock_data
                 
                 # Run CLI
-                runner = CliRunner()
                 with runner.isolated_filesystem():
                     result = runner.invoke(cli.main, [
                         "--email", "test@example.com",
@@ -70,15 +68,11 @@ def test_end_to_end_json_output():
                     assert data["usage"] == 450.0
                     assert data["cost"] == 12500.0
                     assert data["co2"] == 225.0
-                    
-                    print("✓ End-to-end JSON output test passed")
 
 
-def test_end_to_end_console_output():
+def test_end_to_end_console_output(runner):
     """Test complete workflow with console output."""
-    print("\n=== Testing end-to-end console output ===")
-    
-    with patch("enecoq_data_fetcher.controller.sync_playwright") as mock_playwright:
+    with patch("playwright.sync_api.sync_playwright") as mock_playwright:
         # Setup mock browser automation
         mock_browser = Mock()
         mock_context = Mock()
@@ -102,7 +96,6 @@ def test_end_to_end_console_output():
                 mock_fetch.return_value = mock_data
                 
                 # Run CLI
-                runner = CliRunner()
                 result = runner.invoke(cli.main, [
                     "--email", "test@example.com",
                     "--password", "test123",
@@ -116,14 +109,10 @@ def test_end_to_end_console_output():
                 assert "12.5" in result.output
                 assert "350.0" in result.output
                 assert "6.25" in result.output
-                
-                print("✓ End-to-end console output test passed")
 
 
 def test_controller_with_config():
     """Test controller initialization with configuration."""
-    print("\n=== Testing controller with config ===")
-    
     # Create custom config
     cfg = config.Config(
         log_level="DEBUG",
@@ -142,15 +131,194 @@ def test_controller_with_config():
     assert ctl._config.log_level == "DEBUG"
     assert ctl._config.timeout == 60
     assert ctl._max_retries == 5
+
+
+def test_controller_import_does_not_load_playwright():
+    """Test importing the controller does not load Playwright."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; import enecoq_data_fetcher.controller; "
+            "print('playwright' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
     
-    print("✓ Controller with config test passed")
+    assert result.stdout.strip() == "False"
 
 
-def test_error_handling_authentication():
-    """Test error handling for authentication failures."""
-    print("\n=== Testing authentication error handling ===")
+def test_controller_blocks_unneeded_resources():
+    """Test controller aborts requests for images, fonts, media and analytics."""
+    patterns = controller.EnecoQController.BLOCKED_URL_PATTERNS
     
-    with patch("enecoq_data_fetcher.controller.sync_playwright") as mock_playwright:
+    for url, blocked in [
+        ("https://www.cyberhome.ne.jp/img/logo.png", True),
+        ("https://www.cyberhome.ne.jp/img/banner.JPG?v=2", True),
+        ("https://ses.me-eco.jp/fonts/icons.woff2", True),
+        ("https://www.cyberhome.ne.jp/movie/intro.mp4#t=0", True),
+        ("https://www.google-analytics.com/g/collect", True),
+        ("https://stats.g.doubleclick.net/j/collect", True),
+        ("https://www.googletagmanager.com/gtag/js", True),
+        ("https://www.cyberhome.ne.jp/app/top.do", False),
+        ("https://www.cyberhome.ne.jp/css/style.css", False),
+        ("https://www.cyberhome.ne.jp/js/app.js", False),
+        ("https://www.cyberhome.ne.jp/js/png.js", False),
+        ("https://notdoubleclick.net/app.js", False),
+    ]:
+        matched = any(pattern.search(url) for pattern in patterns)
+        assert matched is blocked, url
+    
+    # Only the blocked patterns are routed, so other requests keep using
+    # the HTTP cache
+    with patch("playwright.sync_api.sync_playwright") as mock_playwright:
+        mock_browser = Mock()
+        mock_context = Mock()
+        mock_playwright.return_value.__enter__.return_value.chromium.launch.return_value = mock_browser
+        mock_browser.new_context.return_value = mock_context
+        
+        ctl = controller.EnecoQController(
+            email="test@example.com",
+            password="test123",
+        )
+        ctl._execute_with_retry = Mock()
+        ctl._fetch_data_internal("today")
+        
+        routed = [c.args[0] for c in mock_context.route.call_args_list]
+        assert routed == list(patterns)
+    
+    mock_route = Mock()
+    controller.EnecoQController._abort_request(mock_route)
+    mock_route.abort.assert_called_once_with()
+
+
+def test_controller_closes_browser_in_order():
+    """Test page, context and browser are closed even if one close fails."""
+    with patch("playwright.sync_api.sync_playwright") as mock_playwright:
+        # Setup mock browser automation
+        closed = []
+        mock_browser = Mock()
+        mock_context = Mock()
+        mock_page = Mock()
+        
+        mock_playwright.return_value.__enter__.return_value.chromium.launch.return_value = mock_browser
+        mock_browser.new_context.return_value = mock_context
+        mock_context.new_page.return_value = mock_page
+        
+        mock_page.close.side_effect = lambda: closed.append("page")
+        mock_browser.close.side_effect = lambda: closed.append("browser")
+        
+        def fail_context_close():
+            closed.append("context")
+            raise RuntimeError("Context already closed")
+        
+        mock_context.close.side_effect = fail_context_close
+        
+        # Mock successful authentication and data fetch
+        with patch("enecoq_data_fetcher.authenticator.EnecoQAuthenticator.login"):
+            with patch("enecoq_data_fetcher.fetcher.EnecoQDataFetcher.fetch_today_data"):
+                ctl = controller.EnecoQController(
+                    email="test@example.com",
+                    password="test123",
+                )
+                with pytest.raises(RuntimeError, match="Context already closed"):
+                    ctl._fetch_data_internal("today")
+        
+        # Verify the browser was still closed after the context failed
+        assert closed == ["page", "context", "browser"]
+
+
+def test_controller_with_persistent_profile(tmp_path):
+    """Test controller launches a persistent context for a user data dir."""
+    with patch("playwright.sync_api.sync_playwright") as mock_playwright:
+        # Setup mock browser automation
+        mock_chromium = mock_playwright.return_value.__enter__.return_value.chromium
+        mock_context = Mock()
+        mock_page = Mock()
+        
+        mock_chromium.launch_persistent_context.return_value = mock_context
+        mock_context.new_page.return_value = mock_page
+        
+        # Mock successful authentication and data fetch
+        with patch("enecoq_data_fetcher.authenticator.EnecoQAuthenticator.login"):
+            with patch("enecoq_data_fetcher.fetcher.EnecoQDataFetcher.fetch_today_data") as mock_fetch:
+                mock_fetch.return_value = models.PowerData(
+                    period="today",
+                    timestamp=datetime(2024, 1, 15, 10, 30, 0),
+                    usage=models.PowerUsage(value=12.5),
+                    cost=models.PowerCost(value=350.0),
+                    co2=models.CO2Emission(value=6.25),
+                )
+                
+                profile_dir = tmp_path / "profile"
+                cfg = config.Config(user_data_dir=str(profile_dir))
+                ctl = controller.EnecoQController(
+                    email="test@example.com",
+                    password="test123",
+                    config=cfg,
+                )
+                ctl.fetch_power_data(period="today", output_format="console")
+                
+                # Verify the profile directory was created for the user only
+                assert profile_dir.is_dir()
+                assert profile_dir.stat().st_mode & 0o077 == 0
+        
+        # Verify the profile directory was used instead of a fresh browser
+        mock_chromium.launch.assert_not_called()
+        assert mock_context.route.call_count == len(ctl.BLOCKED_URL_PATTERNS)
+        launch_call = mock_chromium.launch_persistent_context.call_args
+        assert launch_call.args[0] == profile_dir
+        assert launch_call.kwargs["user_agent"] == cfg.user_agent
+        mock_context.close.assert_called_once()
+
+
+def test_controller_with_cdp_endpoint():
+    """Test controller connects to a running browser over CDP."""
+    with patch("playwright.sync_api.sync_playwright") as mock_playwright:
+        # Setup mock browser automation
+        mock_chromium = mock_playwright.return_value.__enter__.return_value.chromium
+        mock_browser = Mock()
+        mock_context = Mock()
+        mock_page = Mock()
+        
+        mock_chromium.connect_over_cdp.return_value = mock_browser
+        mock_browser.new_context.return_value = mock_context
+        mock_context.new_page.return_value = mock_page
+        
+        # Mock successful authentication and data fetch
+        with patch("enecoq_data_fetcher.authenticator.EnecoQAuthenticator.login"):
+            with patch("enecoq_data_fetcher.fetcher.EnecoQDataFetcher.fetch_today_data") as mock_fetch:
+                mock_fetch.return_value = models.PowerData(
+                    period="today",
+                    timestamp=datetime(2024, 1, 15, 10, 30, 0),
+                    usage=models.PowerUsage(value=12.5),
+                    cost=models.PowerCost(value=350.0),
+                    co2=models.CO2Emission(value=6.25),
+                )
+                
+                cfg = config.Config(cdp_endpoint="http://127.0.0.1:9222")
+                ctl = controller.EnecoQController(
+                    email="test@example.com",
+                    password="test123",
+                    config=cfg,
+                )
+                ctl.fetch_power_data(period="today", output_format="console")
+        
+        # Verify the running browser was used with a fresh context
+        mock_chromium.launch.assert_not_called()
+        mock_chromium.connect_over_cdp.assert_called_once_with(
+            "http://127.0.0.1:9222"
+        )
+        mock_browser.new_context.assert_called_once_with(user_agent=cfg.user_agent)
+        mock_context.close.assert_called_once()
+        mock_browser.close.assert_called_once()
+
+
+def test_error_handling_authentication(runner):
+    """Test error handling for authentication failures."""
+    with patch("playwright.sync_api.sync_playwright") as mock_playwright:
         # Setup mock browser automation
         mock_browser = Mock()
         mock_context = Mock()
@@ -165,7 +333,6 @@ def test_error_handling_authentication():
             mock_login.side_effect = exceptions.AuthenticationError("Invalid credentials")
             
             # Run CLI
-            runner = CliRunner()
             result = runner.invoke(cli.main, [
                 "--email", "test@example.com",
                 "--password", "wrong",
@@ -175,15 +342,11 @@ def test_error_handling_authentication():
             # Verify error handling
             assert result.exit_code == 1
             assert "Authentication error" in result.output
-            
-            print("✓ Authentication error handling test passed")
 
 
-def test_error_handling_fetch():
+def test_error_handling_fetch(runner):
     """Test error handling for fetch failures."""
-    print("\n=== Testing fetch error handling ===")
-    
-    with patch("enecoq_data_fetcher.controller.sync_playwright") as mock_playwright:
+    with patch("playwright.sync_api.sync_playwright") as mock_playwright:
         # Setup mock browser automation
         mock_browser = Mock()
         mock_context = Mock()
@@ -199,7 +362,6 @@ def test_error_handling_fetch():
                 mock_fetch.side_effect = exceptions.FetchError("Network error")
                 
                 # Run CLI
-                runner = CliRunner()
                 result = runner.invoke(cli.main, [
                     "--email", "test@example.com",
                     "--password", "test123",
@@ -209,77 +371,58 @@ def test_error_handling_fetch():
                 # Verify error handling
                 assert result.exit_code == 2
                 assert "Fetch error" in result.output
-                
-                print("✓ Fetch error handling test passed")
 
 
-def test_config_file_integration():
+def test_config_file_integration(tmp_path, runner):
     """Test configuration file loading integration."""
-    print("\n=== Testing config file integration ===")
-    
     # Skip if PyYAML is not available
-    if not config.YAML_AVAILABLE:
-        print("⊘ Skipping config file test (PyYAML not installed)")
-        return
+    pytest.importorskip("yaml")
     
-    with tempfile.NamedTemporaryFile(
-        mode='w',
-        suffix='.yaml',
-        delete=False,
-        encoding='utf-8'
-    ) as f:
-        f.write("""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("""
 log_level: DEBUG
 timeout: 60
 max_retries: 5
-""")
-        temp_path = f.name
+""", encoding="utf-8")
     
-    try:
-        with patch("enecoq_data_fetcher.controller.sync_playwright") as mock_playwright:
-            # Setup mock browser automation
-            mock_browser = Mock()
-            mock_context = Mock()
-            mock_page = Mock()
-            
-            mock_playwright.return_value.__enter__.return_value.chromium.launch.return_value = mock_browser
-            mock_browser.new_context.return_value = mock_context
-            mock_context.new_page.return_value = mock_page
-            
-            # Mock successful authentication and data fetch
-            with patch("enecoq_data_fetcher.authenticator.EnecoQAuthenticator.login"):
-                with patch("enecoq_data_fetcher.fetcher.EnecoQDataFetcher.fetch_today_data") as mock_fetch:
-                    mock_data = models.PowerData(
-                        period="today",
-                        timestamp=datetime(2024, 1, 15, 10, 30, 0),
-                        usage=models.PowerUsage(value=12.5),
-                        cost=models.PowerCost(value=350.0),
-                        co2=models.CO2Emission(value=6.25),
-                    )
-                    mock_fetch.return_value = mock_data
-                    
-                    # Run CLI with config file
-                    runner = CliRunner()
-                    result = runner.invoke(cli.main, [
-                        "--email", "test@example.com",
-                        "--password", "test123",
-                        "--config", temp_path,
-                        "--format", "console"
-                    ])
-                    
-                    # Verify CLI execution
-                    assert result.exit_code == 0, f"CLI failed: {result.output}"
-                    
-                    print("✓ Config file integration test passed")
-    finally:
-        os.unlink(temp_path)
+    with patch("playwright.sync_api.sync_playwright") as mock_playwright:
+        # Setup mock browser automation
+        mock_browser = Mock()
+        mock_context = Mock()
+        mock_page = Mock()
+        
+        mock_playwright.return_value.__enter__.return_value.chromium.launch.return_value = mock_browser
+        mock_browser.new_context.return_value = mock_context
+        mock_context.new_page.return_value = mock_page
+        
+        # Mock successful authentication and data fetch
+        with patch("enecoq_data_fetcher.authenticator.EnecoQAuthenticator.login"):
+            with patch("enecoq_data_fetcher.fetcher.EnecoQDataFetcher.fetch_today_data") as mock_fetch:
+                mock_data = models.PowerData(
+                    period="today",
+                    timestamp=datetime(2024, 1, 15, 10, 30, 0),
+                    usage=models.PowerUsage(value=12.5),
+                    cost=models.PowerCost(value=350.0),
+                    co2=models.CO2Emission(value=6.25),
+                )
+                mock_fetch.return_value = mock_data
+                
+                # Run CLI with config file
+                result = runner.invoke(cli.main, [
+                    "--email", "test@example.com",
+                    "--password", "test123",
+                    "--config", str(config_file),
+                    "--period", "today",
+                    "--format", "console"
+                ])
+                
+                # Verify CLI execution
+                assert result.exit_code == 0, f"CLI failed: {result.output}"
 
 
 def test_retry_mechanism():
     """Test retry mechanism for transient failures."""
-    print("\n=== Testing retry mechanism ===")
-    
-    with patch("enecoq_data_fetcher.controller.sync_playwright") as mock_playwright:
+    with patch("playwright.sync_api.sync_playwright") as mock_playwright:
         # Setup mock browser automation
         mock_browser = Mock()
         mock_context = Mock()
@@ -321,13 +464,36 @@ def test_retry_mechanism():
                 assert result.usage.value == 450.0
                 assert mock_fetch.call_count == 2  # First failed, second succeeded
                 
-                print("✓ Retry mechanism test passed")
+                # Verify the browser was reused and each attempt had its
+                # own page
+                mock_chromium = mock_playwright.return_value.__enter__.return_value.chromium
+                mock_chromium.launch.assert_called_once()
+                assert mock_context.new_page.call_count == 2
+                assert mock_page.close.call_count == 2
+
+
+def test_retry_exhausted():
+    """Test retries back off exponentially and then give up."""
+    ctl = controller.EnecoQController(
+        email="test@example.com",
+        password="test123",
+        config=config.Config(max_retries=3),
+    )
+    operation = Mock(side_effect=exceptions.FetchError("Temporary error"))
+    
+    with patch("time.sleep") as mock_sleep:
+        with pytest.raises(exceptions.FetchError) as exc_info:
+            ctl._execute_with_retry(operation)
+        assert exc_info.value.error_code == "RETRY_EXHAUSTED"
+        assert "failed after 3 attempts" in str(exc_info.value)
+    
+    # Waits 2s and 4s between the three attempts
+    assert operation.call_count == 3
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [2, 4]
 
 
 def test_data_model_serialization():
     """Test data model serialization for export."""
-    print("\n=== Testing data model serialization ===")
-    
     # Create power data
     power_data = models.PowerData(
         period="today",
@@ -354,22 +520,3 @@ def test_data_model_serialization():
     # Verify deserialization
     loaded_dict = json.loads(json_str)
     assert loaded_dict["usage"] == 12.5
-    
-    print("✓ Data model serialization test passed")
-
-
-if __name__ == "__main__":
-    print("Running integration tests...")
-    
-    test_end_to_end_json_output()
-    test_end_to_end_console_output()
-    test_controller_with_config()
-    test_error_handling_authentication()
-    test_error_handling_fetch()
-    test_config_file_integration()
-    test_retry_mechanism()
-    test_data_model_serialization()
-    
-    print("\n" + "=" * 50)
-    print("✓ All integration tests passed!")
-    print("=" * 50)
@@ -14,7 +14,9 @@ def test_setup_logger_default():
     
     assert log is not None
     assert log.name == "enecoq_data_fetcher"
-    assert log.level == logging.DEBUG
+    # Nothing below the console level is processed
+    assert log.level == logging.INFO
+    assert not log.isEnabledFor(logging.DEBUG)
     
     # Check handlers - only console handler by default
     assert len(log.handlers) == 1  # Console handler only
@@ -22,7 +24,12 @@ def test_setup_logger_default():
     # Check that sensitive data filter is added
     assert len(log.filters) >= 1
     
-    print("✓ test_setup_logger_default passed")
+    # Setting up again does not stack another filter
+    log = logger.setup_logger()
+    sensitive_filters = [
+        f for f in log.filters if isinstance(f, logger.SensitiveDataFilter)
+    ]
+    assert len(sensitive_filters) == 1
 
 
 def test_setup_logger_custom_level():
@@ -34,8 +41,6 @@ def test_setup_logger_custom_level():
     # Console handler should have WARNING level
     console_handler = log.handlers[0]
     assert console_handler.level == logging.WARNING
-    
-    print("✓ test_setup_logger_custom_level passed")
 
 
 def test_setup_logger_custom_file():
@@ -46,6 +51,9 @@ def test_setup_logger_custom_file():
         
         assert log is not None
         
+        # The file handler records debug messages
+        assert log.isEnabledFor(logging.DEBUG)
+        
         # Write a test message
         log.info("Test message")
         
@@ -55,22 +63,20 @@ def test_setup_logger_custom_file():
         # Read file content
         content = Path(log_file).read_text()
         assert "Test message" in content
-        
-        print("✓ test_setup_logger_custom_file passed")
 
 
 def test_get_logger():
     """Test getting logger instance."""
     # Setup logger first
-    logger.setup_logger()
+    configured = logger.setup_logger()
     
     # Get logger
     log = logger.get_logger()
+    assert log is configured
+    assert log is logging.getLogger("enecoq_data_fetcher")
     
     assert log is not None
     assert log.name == "enecoq_data_fetcher"
-    
-    print("✓ test_get_logger passed")
 
 
 def test_sensitive_data_filter():
@@ -97,7 +103,14 @@ def test_sensitive_data_filter():
     # Message should be masked
     assert "****" in str(record.msg) or "password" in str(record.msg).lower()
     
-    print("✓ test_sensitive_data_filter passed")
+    # Keys match regardless of case, and other messages are left alone
+    for msg, expected in (
+        ("API Token: abc", "API Token: ****"),
+        ("Fetching month's data", "Fetching month's data"),
+    ):
+        record.msg = msg
+        filter_obj.filter(record)
+        assert record.msg == expected
 
 
 def test_logging_integration():
@@ -120,16 +133,3 @@ def test_logging_integration():
         assert "Info message" in content
         assert "Warning message" in content
         assert "Error message" in content
-        
-        print("✓ test_logging_integration passed")
-
-
-if __name__ == "__main__":
-    test_setup_logger_default()
-    test_setup_logger_custom_level()
-    test_setup_logger_custom_file()
-    test_get_logger()
-    test_sensitive_data_filter()
-    test_logging_integration()
-    
-    print("\nAll logger tests passed!")
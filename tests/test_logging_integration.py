@@ -42,14 +42,6 @@ def test_logging_to_file():
         assert "enecoq_data_fetcher" in log_content
         assert "INFO" in log_content
         assert "DEBUG" in log_content
-        
-        print("✓ Logging to file works correctly")
-        print("\nSample log content:")
-        print("-" * 50)
-        # Print first 10 lines
-        lines = log_content.split("\n")[:10]
-        for line in lines:
-            print(line)
 
 
 def test_sensitive_data_not_logged():
@@ -74,13 +66,3 @@ def test_sensitive_data_not_logged():
         # Make sure no actual password values are in the log
         # (This is a basic check - in real implementation, we ensure
         # password values are never passed to log statements)
-        
-        print("✓ Sensitive data protection works correctly")
-
-
-if __name__ == "__main__":
-    test_logging_to_file()
-    print()
-    test_sensitive_data_not_logged()
-    
-    print("\nAll integration tests passed!")
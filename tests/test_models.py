@@ -1,7 +1,10 @@
 """Tests for data models."""
 
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 
+import pytest
+
 from enecoq_data_fetcher import models
 
 
@@ -11,7 +14,6 @@ def test_power_usage_creation():
     
     assert usage.value == 12.5
     assert usage.unit == "kWh"
-    print("✓ PowerUsage creation test passed")
 
 
 def test_power_usage_to_dict():
@@ -21,7 +23,6 @@ def test_power_usage_to_dict():
     
     assert result == 12.5
     assert isinstance(result, float)
-    print("✓ PowerUsage to_dict test passed")
 
 
 def test_power_cost_creation():
@@ -30,7 +31,6 @@ def test_power_cost_creation():
     
     assert cost.value == 350.0
     assert cost.unit == "JPY"
-    print("✓ PowerCost creation test passed")
 
 
 def test_power_cost_to_dict():
@@ -40,7 +40,6 @@ def test_power_cost_to_dict():
     
     assert result == 350.0
     assert isinstance(result, float)
-    print("✓ PowerCost to_dict test passed")
 
 
 def test_co2_emission_creation():
@@ -49,7 +48,6 @@ def test_co2_emission_creation():
     
     assert co2.value == 6.25
     assert co2.unit == "kg"
-    print("✓ CO2Emission creation test passed")
 
 
 def test_co2_emission_to_dict():
@@ -59,7 +57,6 @@ def test_co2_emission_to_dict():
     
     assert result == 6.25
     assert isinstance(result, float)
-    print("✓ CO2Emission to_dict test passed")
 
 
 def test_power_data_creation():
@@ -78,7 +75,6 @@ def test_power_data_creation():
     assert power_data.usage.value == 12.5
     assert power_data.cost.value == 350.0
     assert power_data.co2.value == 6.25
-    print("✓ PowerData creation test passed")
 
 
 def test_power_data_to_dict():
@@ -99,7 +95,6 @@ def test_power_data_to_dict():
     assert result["usage"] == 12.5
     assert result["cost"] == 350.0
     assert result["co2"] == 6.25
-    print("✓ PowerData to_dict test passed")
 
 
 def test_power_data_with_month_period():
@@ -119,7 +114,6 @@ def test_power_data_with_month_period():
     assert result["usage"] == 450.0
     assert result["cost"] == 12500.0
     assert result["co2"] == 225.0
-    print("✓ PowerData with month period test passed")
 
 
 def test_custom_units():
@@ -136,7 +130,32 @@ def test_custom_units():
     assert usage.to_dict() == 100.0
     assert cost.to_dict() == 1000.0
     assert co2.to_dict() == 50.0
-    print("✓ Custom units test passed")
+
+
+def test_models_use_slots():
+    """Test model instances have no per-instance dict."""
+    usage = models.PowerUsage(value=100.0)
+    power_data = models.PowerData(
+        period="today",
+        timestamp=datetime.now(),
+        usage=usage,
+        cost=models.PowerCost(value=1000.0),
+        co2=models.CO2Emission(value=50.0),
+    )
+    
+    for obj in (usage, power_data.cost, power_data.co2, power_data):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_models_are_frozen():
+    """Test model instances are immutable values."""
+    usage = models.PowerUsage(value=100.0)
+    
+    with pytest.raises(FrozenInstanceError):
+        usage.value = 200.0
+    
+    # Equal values hash alike
+    assert hash(usage) == hash(models.PowerUsage(value=100.0))
 
 
 def test_zero_values():
@@ -154,7 +173,6 @@ def test_zero_values():
     assert result["usage"] == 0.0
     assert result["cost"] == 0.0
     assert result["co2"] == 0.0
-    print("✓ Zero values test passed")
 
 
 def test_large_values():
@@ -172,23 +190,3 @@ def test_large_values():
     assert result["usage"] == 9999.99
     assert result["cost"] == 999999.99
     assert result["co2"] == 4999.99
-    print("✓ Large values test passed")
-
-
-if __name__ == "__main__":
-    print("Running model tests...\n")
-    
-    test_power_usage_creation()
-    test_power_usage_to_dict()
-    test_power_cost_creation()
-    test_power_cost_to_dict()
-    test_co2_emission_creation()
-    test_co2_emission_to_dict()
-    test_power_data_creation()
-    test_power_data_to_dict()
-    test_power_data_with_month_period()
-    test_custom_units()
-    test_zero_values()
-    test_large_values()
-    
-    print("\n✓ All model tests passed!")
@@ -264,61 +264,3 @@ def test_power_data_json_serializable(period, usage_value, cost_value, co2_value
     assert loaded["usage"] == usage_value
     assert loaded["cost"] == cost_value
     assert loaded["co2"] == co2_value
-
-
-if __name__ == "__main__":
-    print("Running property-based tests...\n")
-    
-    # Run all tests
-    test_power_usage_value_preserved()
-    print("✓ test_power_usage_value_preserved passed")
-    
-    test_power_usage_to_dict_returns_value()
-    print("✓ test_power_usage_to_dict_returns_value passed")
-    
-    test_power_usage_custom_unit_preserved()
-    print("✓ test_power_usage_custom_unit_preserved passed")
-    
-    test_power_cost_value_preserved()
-    print("✓ test_power_cost_value_preserved passed")
-    
-    test_power_cost_to_dict_returns_value()
-    print("✓ test_power_cost_to_dict_returns_value passed")
-    
-    test_power_cost_custom_unit_preserved()
-    print("✓ test_power_cost_custom_unit_preserved passed")
-    
-    test_co2_emission_value_preserved()
-    print("✓ test_co2_emission_value_preserved passed")
-    
-    test_co2_emission_to_dict_returns_value()
-    print("✓ test_co2_emission_to_dict_returns_value passed")
-    
-    test_power_data_preserves_all_values()
-    print("✓ test_power_data_preserves_all_values passed")
-    
-    test_power_data_to_dict_structure()
-    print("✓ test_power_data_to_dict_structure passed")
-    
-    test_power_data_to_dict_timestamp_is_iso_format()
-    print("✓ test_power_data_to_dict_timestamp_is_iso_format passed")
-    
-    test_enecoq_error_message_preserved()
-    print("✓ test_enecoq_error_message_preserved passed")
-    
-    test_enecoq_error_with_code_format()
-    print("✓ test_enecoq_error_with_code_format passed")
-    
-    test_authentication_error_is_enecoq_error()
-    print("✓ test_authentication_error_is_enecoq_error passed")
-    
-    test_fetch_error_is_enecoq_error()
-    print("✓ test_fetch_error_is_enecoq_error passed")
-    
-    test_export_error_is_enecoq_error()
-    print("✓ test_export_error_is_enecoq_error passed")
-    
-    test_power_data_json_serializable()
-    print("✓ test_power_data_json_serializable passed")
-    
-    print("\n✓ All property-based tests passed!")